@@ -1,40 +1,84 @@
 import os
+import json
+import time
+from pathlib import Path
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import ClassVar, Dict, List, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
-load_dotenv()
+# Containers and CI inject credentials directly; only parse .env when they're missing
+if not (os.environ.get('AZURE_OPENAI_API_KEY') and os.environ.get('AZURE_OPENAI_ENDPOINT')):
+    load_dotenv()
 
+def _env(name: str, default=None, cast=None):
+    """Build a dataclass default factory reading ``name`` from the environment"""
+    def factory():
+        value = os.getenv(name, default)
+        return cast(value) if cast is not None and value is not None else value
+    return factory
+
+def _flag(value: str) -> bool:
+    """Parse a boolean environment value such as 'true', '1' or 'yes'"""
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'on')
+
+@lru_cache(maxsize=None)
+def _load_scenario_catalog(path: Path) -> Dict[str, Dict]:
+    """Parse the demo scenario catalog once per path"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _truncated(items: List[str], limit: int) -> str:
+    return ", ".join(items[:limit]) + ("..." if len(items) > limit else "")
+
+@lru_cache(maxsize=None)
+def _scenario_menu_rows(path: Path) -> Tuple[Tuple[str, str, str, str, str], ...]:
+    """Pre-format (key, name, focus areas, target score, devices) rows for the scenario menu"""
+    return tuple(
+        (key, scenario['name'], _truncated(scenario.get('focus_areas', []), 2),
+         str(scenario.get('target_score', 'N/A')), _truncated(scenario['devices'], 3))
+        for key, scenario in _load_scenario_catalog(path).items()
+    )
+
+@dataclass(frozen=True, slots=True)
 class Config:
     # Azure OpenAI Configuration
-    AZURE_OPENAI_API_KEY = os.getenv('AZURE_OPENAI_API_KEY')
-    AZURE_OPENAI_ENDPOINT = os.getenv('AZURE_OPENAI_ENDPOINT')
-    AZURE_OPENAI_API_VERSION = os.getenv('AZURE_OPENAI_API_VERSION', '2024-04-01-preview')
-    AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME', 'gpt-4.1')
-    AZURE_OPENAI_EMBED_DEPLOYMENT_NAME = os.getenv('AZURE_OPENAI_EMBED_DEPLOYMENT_NAME', 'text-embedding-3-large')
+    AZURE_OPENAI_API_KEY: Optional[str] = field(default_factory=_env('AZURE_OPENAI_API_KEY'))
+    AZURE_OPENAI_ENDPOINT: Optional[str] = field(default_factory=_env('AZURE_OPENAI_ENDPOINT'))
+    AZURE_OPENAI_API_VERSION: str = field(default_factory=_env('AZURE_OPENAI_API_VERSION', '2024-04-01-preview'))
+    AZURE_OPENAI_DEPLOYMENT_NAME: str = field(default_factory=_env('AZURE_OPENAI_DEPLOYMENT_NAME', 'gpt-4.1'))
+    AZURE_OPENAI_EMBED_DEPLOYMENT_NAME: str = field(default_factory=_env('AZURE_OPENAI_EMBED_DEPLOYMENT_NAME', 'text-embedding-3-large'))
+    # Global-batch deployment; when set, automated runs go through the Batch API
+    AZURE_OPENAI_BATCH_DEPLOYMENT_NAME: Optional[str] = field(default_factory=_env('AZURE_OPENAI_BATCH_DEPLOYMENT_NAME'))
     
     # Legacy Google Gemini (kept for backward compatibility)
-    GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
+    GOOGLE_API_KEY: Optional[str] = field(default_factory=_env('GOOGLE_API_KEY'))
     
-    MAX_RETRIES = int(os.getenv('MAX_RETRIES', 3))
-    TEMPERATURE = float(os.getenv('TEMPERATURE', 0.7))
+    MAX_RETRIES: int = field(default_factory=_env('MAX_RETRIES', 3, int))
+    MAX_CONCURRENCY: int = field(default_factory=_env('MAX_CONCURRENCY', 8, int))  # LLM requests in flight across the whole run
+    TEMPERATURE: float = field(default_factory=_env('TEMPERATURE', 0.7, float))
 
     # Paths
-    SPECS_DIR = 'specifications'
-    TEMPLATES_DIR = 'templates'
-    EXAMPLES_DIR = 'examples'
-    OUTPUT_DIR = 'output/recordings'
-    REDFISH_MOCKUPS_DIR = 'DSP2043_2025.2'
+    SPECS_DIR: ClassVar[str] = 'specifications'
+    TEMPLATES_DIR: ClassVar[str] = 'templates'
+    EXAMPLES_DIR: ClassVar[str] = 'examples'
+    OUTPUT_DIR: ClassVar[str] = 'output/recordings'
+    RECORDING_FORMAT: str = field(default_factory=_env('RECORDING_FORMAT', 'directory'))  # directory, tar
+    REDFISH_MOCKUPS_DIR: ClassVar[str] = 'DSP2043_2025.2'
     
     # Redfish Configuration
-    STRICT_VALIDATION = True
-    SCHEMA_VERSION = '2025.2'
-    REDFISH_VERSION = '1.19.0'
+    STRICT_VALIDATION: ClassVar[bool] = True
+    SCHEMA_VERSION: ClassVar[str] = '2025.2'
+    REDFISH_VERSION: ClassVar[str] = '1.19.0'
     
     # Demo Configuration
-    DEMO_MODE = os.getenv('DEMO_MODE', 'interactive')  # interactive, automated, presentation
-    DEMO_SPEED = float(os.getenv('DEMO_SPEED', '1.0'))  # Speed multiplier for demo
+    DEMO_MODE: str = field(default_factory=_env('DEMO_MODE', 'interactive'))  # interactive, automated, presentation
+    DEMO_SPEED: float = field(default_factory=_env('DEMO_SPEED', '1.0', float))  # Speed multiplier for demo
+    DEMO_PACING: bool = field(default_factory=_env('DEMO_PACING', 'false', _flag))  # Opt-in pauses between demo steps for presenters
     
     # Available Redfish Mockup Profiles
-    REDFISH_PROFILES = [
+    REDFISH_PROFILES: ClassVar[Tuple[str, ...]] = (
         'public-localstorage',
         'public-bladed',
         'public-rackmount1',
@@ -44,119 +88,72 @@ class Config:
         'public-nvmeof-jbof',
         'public-smartnic',
         'public-telemetry'
-    ]
+    )
     
-    # Enhanced Demo Scenarios for SNIA SDC 2025
-    DEMO_SCENARIOS = {
-        'enterprise_storage': {
-            'name': 'Enterprise Storage Infrastructure',
-            'description': 'High-performance, scalable, enterprise-grade storage infrastructure with advanced features',
-            'profiles': ['public-localstorage', 'public-nvmeof-jbof', 'public-sasfabric'],
-            'devices': ['StorageController', 'Drive', 'Volume', 'StoragePool'],
-            'focus_areas': [
-                'RAID technologies and data protection',
-                'NVMe and high-speed protocols',
-                'Storage virtualization and pooling',
-                'Enterprise management and monitoring',
-                'SNIA Swordfish extensions'
-            ],
-            'target_score': 90
-        },
-        'high_performance_compute': {
-            'name': 'High-Performance Computing Infrastructure',
-            'description': 'Modern compute infrastructure optimized for performance, scalability, and enterprise workloads',
-            'profiles': ['public-rackmount1', 'public-bladed', 'public-composability', 'public-cxl'],
-            'devices': ['ComputerSystem', 'Processor', 'Memory', 'NetworkAdapter'],
-            'focus_areas': [
-                'Multi-core processor architectures',
-                'High-speed memory technologies',
-                'Network performance optimization',
-                'Virtualization and composability',
-                'Power and thermal management'
-            ],
-            'target_score': 88
-        },
-        'modular_infrastructure': {
-            'name': 'Modular and Composable Infrastructure',
-            'description': 'Flexible, scalable infrastructure with modular design and composable capabilities',
-            'profiles': ['public-composability', 'public-cxl', 'public-rackmount1'],
-            'devices': ['Chassis', 'Manager', 'Fabric', 'Switch', 'Port'],
-            'focus_areas': [
-                'Modular chassis design',
-                'Fabric interconnect technologies',
-                'Management and orchestration',
-                'Physical security and monitoring',
-                'Scalability and growth'
-            ],
-            'target_score': 85
-        },
-        'edge_computing': {
-            'name': 'Edge Computing Infrastructure',
-            'description': 'Distributed, resilient infrastructure optimized for edge workloads and IoT integration',
-            'profiles': ['public-tower', 'public-localstorage', 'public-smartnic'],
-            'devices': ['ComputerSystem', 'StorageController', 'Drive', 'Chassis'],
-            'focus_areas': [
-                'Edge-optimized form factors',
-                'Local storage and processing',
-                'Network connectivity options',
-                'Environmental resilience',
-                'Remote management'
-            ],
-            'target_score': 82
-        },
-        'cloud_native': {
-            'name': 'Cloud-Native Infrastructure',
-            'description': 'Scalable, automated infrastructure designed for cloud-native workloads and orchestration',
-            'profiles': ['public-composability', 'public-rackmount1', 'public-localstorage'],
-            'devices': ['ComputerSystem', 'StorageController', 'Manager'],
-            'focus_areas': [
-                'Automation and orchestration',
-                'Scalable architecture',
-                'API-driven management',
-                'Multi-tenant support',
-                'Cloud integration'
-            ],
-            'target_score': 87
-        },
-        'ai_ml_ready': {
-            'name': 'AI/ML Ready Infrastructure',
-            'description': 'High-performance infrastructure optimized for artificial intelligence and machine learning workloads',
-            'profiles': ['public-rackmount1', 'public-composability', 'public-cxl', 'public-smartnic'],
-            'devices': ['ComputerSystem', 'Processor', 'Memory', 'StorageController'],
-            'focus_areas': [
-                'GPU and accelerator support',
-                'High-speed interconnects',
-                'Large memory configurations',
-                'Storage performance',
-                'Network optimization'
-            ],
-            'target_score': 89
-        }
-    }
+    # Human-readable descriptions of the mockup profiles
+    PROFILE_DESCRIPTIONS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'public-localstorage': 'Local storage infrastructure with controllers and drives',
+        'public-bladed': 'Blade server infrastructure with compute and storage',
+        'public-rackmount1': 'Standard rackmount server infrastructure',
+        'public-tower': 'Tower server infrastructure for small deployments',
+        'public-composability': 'Composable infrastructure with dynamic resource allocation',
+        'public-cxl': 'Compute Express Link infrastructure for memory expansion',
+        'public-nvmeof-jbof': 'NVMe over Fabrics with Just a Bunch of Flash',
+        'public-smartnic': 'Smart network interface cards with offload capabilities',
+        'public-telemetry': 'Infrastructure telemetry and monitoring',
+        'public-sasfabric': 'SAS fabric infrastructure for storage connectivity'
+    })
     
     # Enhanced Template Configuration
-    TEMPLATE_FILES = {
+    TEMPLATE_FILES: ClassVar[Mapping[str, Path]] = MappingProxyType({k: Path(v) for k, v in {
         'validation_rules': 'templates/validation_rules.json',
         'device_prompts': 'templates/device_prompts.json',
         'demo_scenarios': 'templates/demo_scenarios.json',
         'presentation_templates': 'templates/presentation_templates.json',
         'quality_metrics': 'templates/quality_metrics.json',
-        'enterprise_features': 'templates/enterprise_features.json'
-    }
+        'enterprise_features': 'templates/enterprise_features.json',
+        'scenario_catalog': 'templates/scenario_catalog.json'
+    }.items()})
+    
+    # Enhanced Demo Scenarios for SNIA SDC 2025, kept in the scenario catalog
+    # and parsed on first access rather than at import
+    @property
+    def DEMO_SCENARIOS(self) -> Dict[str, Dict]:
+        return _load_scenario_catalog(self.TEMPLATE_FILES['scenario_catalog'])
+    
+    @property
+    def DEMO_SCENARIO_ROWS(self) -> Tuple[Tuple[str, str, str, str, str], ...]:
+        return _scenario_menu_rows(self.TEMPLATE_FILES['scenario_catalog'])
+    
+    def get_demo_scenario(self, key: str) -> Optional[Dict]:
+        """Return a single scenario from the catalog, or None if it isn't defined"""
+        return self.DEMO_SCENARIOS.get(key)
     
     # Quality Assurance Configuration
-    QUALITY_THRESHOLDS = {
+    QUALITY_THRESHOLDS: ClassVar[Mapping[str, int]] = MappingProxyType({
         'presentation_ready': 75,
         'excellent_quality': 90,
         'enterprise_grade': 85,
         'minimum_compliance': 70
-    }
+    })
     
     # Presentation Configuration
-    PRESENTATION_MODE = {
+    PRESENTATION_MODE: ClassVar[Mapping[str, bool]] = MappingProxyType({
         'snia_sdc_2025': True,
         'professional_demo': True,
         'audience_engagement': True,
         'live_generation': True,
         'quality_validation': True
-    }
+    })
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide configuration, reading the environment once"""
+    return Config()
+
+def pace(seconds: float):
+    """Pause between demo steps when DEMO_PACING is on, scaled by DEMO_SPEED; never in automated mode"""
+    config = get_config()
+    if not config.DEMO_PACING or config.DEMO_MODE == 'automated' or config.DEMO_SPEED <= 0:
+        return
+    time.sleep(seconds / config.DEMO_SPEED)
@@ -4,38 +4,239 @@ Enhanced Demo Script for SNIA SDC 2025 Presentation
 This script provides a comprehensive, automated demo flow showcasing the AI-Driven Digital Twin capabilities
 """
 
-import time
-import json
-from datetime import datetime
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import track
-from rich.layout import Layout
-from rich.text import Text
-from config import Config
-from src import PromptProcessor, SimulationEngine, RecordingGenerator, ResponseValidator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import starmap
+from types import MappingProxyType
+from typing import NamedTuple
+from config import get_config, pace
 
-console = Console()
+# Rich and the src package (LangChain, Azure OpenAI SDK) are imported at point
+# of use so that startup and early-exit paths don't pay for the full import graph.
+
+@lru_cache(maxsize=1)
+def get_console():
+    """Return the shared Rich console, creating it on first use"""
+    from rich.console import Console
+    return Console()
+
+def render(build, *args):
+    """Build and print a table unless running automated, where nobody reads it"""
+    if get_config().DEMO_MODE == 'automated':
+        return
+    get_console().print(build(*args))
+
+BENEFITS = (
+    ("Hardware Required", "Physical devices needed", "Zero hardware dependency", "100% reduction"),
+    ("Time to Deploy", "Weeks to months", "Minutes", "99% faster"),
+    ("Cost per Prototype", "$10,000+", "API costs only (~$0.01)", "99.999% cheaper"),
+    ("Scalability", "Limited by hardware", "Unlimited virtual devices", "Infinite scale"),
+    ("Edge Cases", "Difficult to replicate", "Easy to simulate", "100% coverage"),
+    ("Standards Compliance", "Manual verification", "Automated validation", "100% accuracy"),
+    ("Profile Support", "Limited examples", "Full DMTF mockup integration", "Complete coverage")
+)
+
+# Sample resources shown when a live scenario run fails; read-only so repeated
+# fallbacks can't mutate them
+FALLBACK_STORAGE_DEVICES = (
+    MappingProxyType({
+        "@odata.type": "#StorageController.v1_0_0.StorageController",
+        "@odata.id": "/redfish/v1/Storage/1/Controllers/1",
+        "Id": "1",
+        "Name": "Storage Controller 1",
+        "Status": MappingProxyType({"State": "Enabled", "Health": "OK"}),
+        "Manufacturer": "Digital Twin Corp",
+        "Model": "DT-SC-3000",
+        "SerialNumber": "2M220100SL"
+    }),
+    MappingProxyType({
+        "@odata.type": "#Drive.v1_0_0.Drive",
+        "@odata.id": "/redfish/v1/Storage/1/Drives/1",
+        "Id": "1",
+        "Name": "Drive 1",
+        "Status": MappingProxyType({"State": "Enabled", "Health": "OK"}),
+        "CapacityBytes": 1000000000000,
+        "Protocol": "NVMe"
+    })
+)
+
+FALLBACK_COMPUTE_DEVICES = (
+    MappingProxyType({
+        "@odata.type": "#ComputerSystem.v1_19_0.ComputerSystem",
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Id": "1",
+        "Name": "Compute Node 1",
+        "Status": MappingProxyType({"State": "Enabled", "Health": "OK"}),
+        "Manufacturer": "Digital Twin Corp",
+        "Model": "DT-CS-5000",
+        "SerialNumber": "2M220100SL"
+    }),
+)
+
+ARCHITECTURE_MARKUP = """
+    [bold]System Architecture:[/bold]
+    
+    [cyan]1. DMTF Redfish 2025.2 Integration[/cyan]
+       • Direct access to official mockup profiles
+       • Schema validation against latest specifications
+       • Profile-based device generation
+    
+    [cyan]2. AI-Powered Generation Engine[/cyan]
+       • Azure OpenAI GPT-4 integration via LangChain
+       • Context-aware prompt engineering
+       • Multi-retry validation pipeline
+    
+    [cyan]3. Comprehensive Validation System[/cyan]
+       • JSON schema compliance checking
+       • Redfish property validation
+       • Data type and constraint verification
+    
+    [cyan]4. Recording and Output Management[/cyan]
+       • Redfish-compliant folder structures
+       • Metadata generation and tracking
+       • Export capabilities for integration
+    
+    [bold]Key Technologies:[/bold]
+    • Python 3.13 with modern async capabilities
+    • LangChain for LLM orchestration
+    • Rich for enhanced terminal experience
+    • Pydantic for data validation
+    • JSON Schema for compliance checking
+    """
+
+class ValidationStats(NamedTuple):
+    """Compliance figures shown in the validation step and the demo summary"""
+    total_devices: int
+    valid_devices: int
+    compliance_rate: float
+    redfish_version: str
+    schema_version: str
+
+@lru_cache(maxsize=1)
+def build_benefits_table():
+    """Build the static benefits table once and reuse it across runs"""
+    from rich.table import Table
+
+    benefits_table = Table(title="AI-Driven Digital Twin Benefits", show_header=True, header_style="bold cyan")
+    benefits_table.add_column("Capability", style="yellow")
+    benefits_table.add_column("Traditional Approach", style="red")
+    benefits_table.add_column("AI-Driven Digital Twin", style="green")
+    benefits_table.add_column("Improvement", style="blue")
+    # exhaust the lazy starmap so rows are added without a Python-level loop
+    list(starmap(benefits_table.add_row, BENEFITS))
+    return benefits_table
+
+@lru_cache(maxsize=1)
+def build_architecture_text():
+    """Parse the architecture overview markup once and reuse the renderable"""
+    return get_console().render_str(ARCHITECTURE_MARKUP)
+
+def build_profile_table(prompt_processor, profiles):
+    """Build the overview table for the first few Redfish profiles"""
+    from rich.table import Table
+
+    profile_table = Table(title="Available Redfish Profiles", show_header=True, header_style="bold magenta")
+    profile_table.add_column("Profile", style="cyan", no_wrap=True)
+    profile_table.add_column("Description", style="white")
+    profile_table.add_column("Resources", style="green")
+    
+    descriptions = get_config().PROFILE_DESCRIPTIONS
+    for profile in profiles[:5]:  # Show first 5 profiles
+        profile_data = prompt_processor.redfish_mockups.get(profile, {})
+        resources = list(profile_data.get('resources', {}).keys())
+        description = descriptions.get(profile, 'Redfish infrastructure profile')
+        
+        profile_table.add_row(
+            profile,
+            description,
+            ", ".join(resources[:2]) + ("..." if len(resources) > 2 else "")
+        )
+    return profile_table
+
+def build_validation_table(validation_stats: ValidationStats):
+    """Build the compliance validation table"""
+    from rich.table import Table
+
+    validation_table = Table(title="Compliance Validation Results", show_header=True, header_style="bold green")
+    validation_table.add_column("Metric", style="cyan")
+    validation_table.add_column("Value", style="white")
+    validation_table.add_column("Status", style="green")
+    
+    validation_table.add_row("Total Devices", str(validation_stats.total_devices), "✓")
+    validation_table.add_row("Valid Devices", str(validation_stats.valid_devices), "✓")
+    validation_table.add_row("Compliance Rate", f"{validation_stats.compliance_rate}%", "✓")
+    validation_table.add_row("Redfish Version", validation_stats.redfish_version, "✓")
+    validation_table.add_row("Schema Version", validation_stats.schema_version, "✓")
+    return validation_table
+
+def build_demo_summary_table(summary_stats: dict):
+    """Build the closing demo summary table"""
+    from rich.table import Table
+
+    summary_table = Table(title="Demo Summary", show_header=True, header_style="bold green")
+    summary_table.add_column("Metric", style="cyan")
+    summary_table.add_column("Value", style="white")
+    
+    list(starmap(summary_table.add_row,
+                 ((metric.replace('_', ' ').title(), str(value)) for metric, value in summary_stats.items())))
+    return summary_table
+
+def build_scenario_table(results: dict):
+    """Build the per-resource-type generation summary for a scenario run"""
+    from rich.table import Table
+
+    summary_table = Table(title="Generation Summary", show_header=True, header_style="bold green")
+    summary_table.add_column("Resource Type", style="cyan")
+    summary_table.add_column("Count", style="white")
+    summary_table.add_column("Profile", style="yellow")
+    summary_table.add_column("Status", style="green")
+    
+    rows = [
+        (resource_type, str(data['count']), data['profile'], f"✓ {data['count']} generated")
+        for resource_type, data in results['devices'].items()
+    ]
+    list(starmap(summary_table.add_row, rows))
+    return summary_table
+
+def build_infrastructure_table(results: dict):
+    """Build the infrastructure component summary table"""
+    from rich.table import Table
+
+    summary_table = Table(title="Infrastructure Components", show_header=True, header_style="bold blue")
+    summary_table.add_column("Component", style="cyan")
+    summary_table.add_column("Type", style="white")
+    summary_table.add_column("Count", style="yellow")
+    summary_table.add_column("Status", style="green")
+    
+    rows = [
+        (component.replace('_', ' ').title(), data['type'], str(data['count']), f"✓ {data['count']} generated")
+        for component, data in results['infrastructure'].items()
+    ]
+    list(starmap(summary_table.add_row, rows))
+    return summary_table
 
 def run_comprehensive_demo():
     """Run the comprehensive demonstration"""
-    config = Config()
+    from rich.panel import Panel
+    from src import PromptProcessor, SimulationEngine, RecordingGenerator, ResponseValidator
+
+    console = get_console()
+    config = get_config()
     
     # Initialize components
     console.print(Panel("[bold cyan]AI-Driven Digital Twin System Initialization[/bold cyan]\n"
                         "Loading DMTF Redfish 2025.2 specifications and Azure OpenAI components...", 
                         title="System Startup", border_style="cyan"))
-    time.sleep(1)
+    pace(1)
     
     prompt_processor = PromptProcessor(config)
     validator = ResponseValidator(config)
-    simulation_engine = SimulationEngine(config, prompt_processor, validator)
+    # No live spinners in automated runs (CI, the demo-runner container)
+    simulation_engine = SimulationEngine(config, prompt_processor, validator, quiet=config.DEMO_MODE == 'automated')
     recording_generator = RecordingGenerator(config)
     
     console.print("[green]✓[/green] All components initialized successfully\n")
-    time.sleep(1)
+    pace(1)
     
     # Demo flow
     demo_steps = [
@@ -50,13 +251,13 @@ def run_comprehensive_demo():
     ]
     
     # Execute demo steps
-    for step_name, step_description in track(demo_steps, description="Initializing system..."):
-        console.print(f"[bold]📋 {step_name}[/bold]")
-        console.print(f"  {step_description}")
-        time.sleep(0.5)
+    total_steps = len(demo_steps)
+    for i, (step_name, step_description) in enumerate(demo_steps, 1):
+        console.print(f"[bold]📋 [{i}/{total_steps}] {step_name}[/bold]\n  {step_description}")
+        pace(0.5)
     
     console.print("\n[bold][green]✓[/green][/bold] System ready for demonstration!\n")
-    time.sleep(1)
+    pace(1)
     
     # Step 1: Profile Overview
     console.print(Panel("[bold]Step 1: Redfish Profile Overview[/bold]\n"
@@ -66,38 +267,9 @@ def run_comprehensive_demo():
     profiles = prompt_processor.get_available_profiles()
     console.print(f"Found {len(profiles)} Redfish profiles from DSP2043_2025.2 bundle")
     
-    profile_table = Table(title="Available Redfish Profiles", show_header=True, header_style="bold magenta")
-    profile_table.add_column("Profile", style="cyan", no_wrap=True)
-    profile_table.add_column("Description", style="white")
-    profile_table.add_column("Resources", style="green")
-    
-    profile_descriptions = {
-        'public-localstorage': 'Local storage infrastructure with controllers and drives',
-        'public-bladed': 'Blade server infrastructure with compute and storage',
-        'public-rackmount1': 'Standard rackmount server infrastructure',
-        'public-tower': 'Tower server infrastructure for small deployments',
-        'public-composability': 'Composable infrastructure with dynamic resource allocation',
-        'public-cxl': 'Compute Express Link infrastructure for memory expansion',
-        'public-nvmeof-jbof': 'NVMe over Fabrics with Just a Bunch of Flash',
-        'public-smartnic': 'Smart network interface cards with offload capabilities',
-        'public-telemetry': 'Infrastructure telemetry and monitoring',
-        'public-sasfabric': 'SAS fabric infrastructure for storage connectivity'
-    }
-    
-    for profile in profiles[:5]:  # Show first 5 profiles
-        profile_data = prompt_processor.redfish_mockups.get(profile, {})
-        resources = list(profile_data.get('resources', {}).keys())
-        description = profile_descriptions.get(profile, 'Redfish infrastructure profile')
-        
-        profile_table.add_row(
-            profile,
-            description,
-            ", ".join(resources[:2]) + ("..." if len(resources) > 2 else "")
-        )
-    
-    console.print(profile_table)
+    render(build_profile_table, prompt_processor, profiles)
     console.print(f"[dim]... and {len(profiles) - 5} more profiles available[/dim]\n")
-    time.sleep(2)
+    pace(2)
     
     # Step 2: Storage Infrastructure Demo
     console.print(Panel("[bold]Step 2: Storage Infrastructure Demo[/bold]\n"
@@ -112,14 +284,14 @@ def run_comprehensive_demo():
         display_scenario_results(results)
         
         # Generate Redfish-compliant recording for each resource type
-        all_devices = []
-        for resource_type, data in results['devices'].items():
-            # write one recording per resource type
-            rec_path = recording_generator.generate_recording(
-                data['devices'], resource_type, resource_type
-            )
-            console.print(f"[cyan]Recording saved:[/cyan] {rec_path}")
-            all_devices.extend(data['devices'])
+        # recordings are independent disk writes, so write them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(results['devices']) or 1)) as executor:
+            futures = {
+                executor.submit(recording_generator.generate_recording, data['devices'], resource_type, resource_type): resource_type
+                for resource_type, data in results['devices'].items()
+            }
+            for future in as_completed(futures):
+                console.print(f"[cyan]Recording saved:[/cyan] {future.result()}")
         
     except Exception as e:
         console.print(f"[red]Demo step failed: {e}[/red]")
@@ -127,7 +299,7 @@ def run_comprehensive_demo():
         console.print("Falling back to manual device generation...")
         fallback_storage_demo(simulation_engine)
     
-    time.sleep(2)
+    pace(2)
     
     # Step 3: Compute Infrastructure Demo
     console.print(Panel("[bold]Step 3: Compute Infrastructure Demo[/bold]\n"
@@ -143,7 +315,7 @@ def run_comprehensive_demo():
         console.print(f"[red]Compute demo failed: {e}[/red]")
         fallback_compute_demo(simulation_engine)
     
-    time.sleep(2)
+    pace(2)
     
     # Step 4: Comprehensive Infrastructure
     console.print(Panel("[bold]Step 4: Comprehensive Infrastructure Demo[/bold]\n"
@@ -158,7 +330,7 @@ def run_comprehensive_demo():
     except Exception as e:
         console.print(f"[red]Infrastructure demo failed: {e}[/red]")
     
-    time.sleep(2)
+    pace(2)
     
     # Step 5: Validation and Compliance
     console.print(Panel("[bold]Step 5: Validation and Compliance[/bold]\n"
@@ -166,61 +338,31 @@ def run_comprehensive_demo():
                         title="Validation Demo", border_style="magenta"))
     
     console.print("Running compliance validation pipeline...")
-    time.sleep(1)
+    pace(1)
     
     # Show validation statistics
-    validation_stats = {
-        'total_devices': 25,
-        'valid_devices': 24,
-        'compliance_rate': 96.0,
-        'redfish_version': config.REDFISH_VERSION,
-        'schema_version': config.SCHEMA_VERSION
-    }
-    
-    validation_table = Table(title="Compliance Validation Results", show_header=True, header_style="bold green")
-    validation_table.add_column("Metric", style="cyan")
-    validation_table.add_column("Value", style="white")
-    validation_table.add_column("Status", style="green")
-    
-    validation_table.add_row("Total Devices", str(validation_stats['total_devices']), "✓")
-    validation_table.add_row("Valid Devices", str(validation_stats['valid_devices']), "✓")
-    validation_table.add_row("Compliance Rate", f"{validation_stats['compliance_rate']}%", "✓")
-    validation_table.add_row("Redfish Version", validation_stats['redfish_version'], "✓")
-    validation_table.add_row("Schema Version", validation_stats['schema_version'], "✓")
-    
-    console.print(validation_table)
-    console.print("\n[green]✓[/green] All devices pass Redfish schema validation")
-    console.print("[green]✓[/green] Required properties present and correctly typed")
-    console.print("[green]✓[/green] Value constraints satisfied")
-    console.print("[green]✓[/green] Naming conventions followed\n")
-    
-    time.sleep(2)
+    validation_stats = ValidationStats(
+        total_devices=25,
+        valid_devices=24,
+        compliance_rate=96.0,
+        redfish_version=config.REDFISH_VERSION,
+        schema_version=config.SCHEMA_VERSION
+    )
+    
+    render(build_validation_table, validation_stats)
+    console.print("\n[green]✓[/green] All devices pass Redfish schema validation\n"
+                  "[green]✓[/green] Required properties present and correctly typed\n"
+                  "[green]✓[/green] Value constraints satisfied\n"
+                  "[green]✓[/green] Naming conventions followed\n")
+    
+    pace(2)
     
     # Step 6: Benefits and Impact
     console.print(Panel("[bold]Step 6: Benefits and Impact Analysis[/bold]\n"
                         "Quantifying the value of AI-driven digital twins", 
                         title="Impact Analysis", border_style="cyan"))
     
-    benefits_table = Table(title="AI-Driven Digital Twin Benefits", show_header=True, header_style="bold cyan")
-    benefits_table.add_column("Capability", style="yellow")
-    benefits_table.add_column("Traditional Approach", style="red")
-    benefits_table.add_column("AI-Driven Digital Twin", style="green")
-    benefits_table.add_column("Improvement", style="blue")
-    
-    benefits = [
-        ("Hardware Required", "Physical devices needed", "Zero hardware dependency", "100% reduction"),
-        ("Time to Deploy", "Weeks to months", "Minutes", "99% faster"),
-        ("Cost per Prototype", "$10,000+", "API costs only (~$0.01)", "99.999% cheaper"),
-        ("Scalability", "Limited by hardware", "Unlimited virtual devices", "Infinite scale"),
-        ("Edge Cases", "Difficult to replicate", "Easy to simulate", "100% coverage"),
-        ("Standards Compliance", "Manual verification", "Automated validation", "100% accuracy"),
-        ("Profile Support", "Limited examples", "Full DMTF mockup integration", "Complete coverage")
-    ]
-    
-    for capability, traditional, ai_driven, improvement in benefits:
-        benefits_table.add_row(capability, traditional, ai_driven, improvement)
-    
-    console.print(benefits_table)
+    render(build_benefits_table)
     console.print()
     
     # Step 7: Technical Architecture
@@ -228,39 +370,8 @@ def run_comprehensive_demo():
                         "Understanding the system design and components", 
                         title="Architecture", border_style="blue"))
     
-    architecture_text = f"""
-    [bold]System Architecture:[/bold]
-    
-    [cyan]1. DMTF Redfish 2025.2 Integration[/cyan]
-       • Direct access to official mockup profiles
-       • Schema validation against latest specifications
-       • Profile-based device generation
-    
-    [cyan]2. AI-Powered Generation Engine[/cyan]
-       • Azure OpenAI GPT-4 integration via LangChain
-       • Context-aware prompt engineering
-       • Multi-retry validation pipeline
-    
-    [cyan]3. Comprehensive Validation System[/cyan]
-       • JSON schema compliance checking
-       • Redfish property validation
-       • Data type and constraint verification
-    
-    [cyan]4. Recording and Output Management[/cyan]
-       • Redfish-compliant folder structures
-       • Metadata generation and tracking
-       • Export capabilities for integration
-    
-    [bold]Key Technologies:[/bold]
-    • Python 3.13 with modern async capabilities
-    • LangChain for LLM orchestration
-    • Rich for enhanced terminal experience
-    • Pydantic for data validation
-    • JSON Schema for compliance checking
-    """
-    
-    console.print(architecture_text)
-    time.sleep(2)
+    console.print(build_architecture_text())
+    pace(2)
     
     # Final Summary
     console.print(Panel("[bold]Demo Complete![/bold]\n"
@@ -269,133 +380,64 @@ def run_comprehensive_demo():
     
     summary_stats = {
         'profiles_explored': len(profiles),
-        'devices_generated': validation_stats['total_devices'],
-        'compliance_rate': validation_stats['compliance_rate'],
+        'devices_generated': validation_stats.total_devices,
+        'compliance_rate': validation_stats.compliance_rate,
         'redfish_version': config.REDFISH_VERSION,
         'demo_duration': '~10 minutes'
     }
     
-    summary_table = Table(title="Demo Summary", show_header=True, header_style="bold green")
-    summary_table.add_column("Metric", style="cyan")
-    summary_table.add_column("Value", style="white")
-    
-    for metric, value in summary_stats.items():
-        summary_table.add_row(metric.replace('_', ' ').title(), str(value))
-    
-    console.print(summary_table)
-    console.print("\n[bold]Next Steps:[/bold]")
-    console.print("• Explore the interactive menu with 'python main.py'")
-    console.print("• Generate custom devices for your specific use cases")
-    console.print("• Integrate with your existing Redfish infrastructure")
-    console.print("• Extend the system with additional device types")
-    
-    console.print("\n[bold]Questions?[/bold] Let's discuss how this can accelerate your development!")
+    render(build_demo_summary_table, summary_stats)
+    console.print("\n[bold]Next Steps:[/bold]\n"
+                  "• Explore the interactive menu with 'python main.py'\n"
+                  "• Generate custom devices for your specific use cases\n"
+                  "• Integrate with your existing Redfish infrastructure\n"
+                  "• Extend the system with additional device types\n"
+                  "\n[bold]Questions?[/bold] Let's discuss how this can accelerate your development!")
 
 def display_scenario_results(results: dict):
     """Display results from a demo scenario"""
+    console = get_console()
     console.print(f"\n[bold]Scenario Results: {results['scenario']}[/bold]")
     
-    summary_table = Table(title="Generation Summary", show_header=True, header_style="bold green")
-    summary_table.add_column("Resource Type", style="cyan")
-    summary_table.add_column("Count", style="white")
-    summary_table.add_column("Profile", style="yellow")
-    summary_table.add_column("Status", style="green")
-    
-    for resource_type, data in results['devices'].items():
-        status = f"✓ {data['count']} generated"
-        summary_table.add_row(
-            resource_type,
-            str(data['count']),
-            data['profile'],
-            status
-        )
-    
-    console.print(summary_table)
+    render(build_scenario_table, results)
     
     # Overall statistics
-    console.print(f"\n[bold]Overall Statistics:[/bold]")
-    console.print(f"  Total Devices Generated: {results['total_generated']}")
-    console.print(f"  Total Valid Devices: {results['total_valid']}")
-    console.print(f"  Success Rate: {(results['total_valid']/results['total_generated']*100):.1f}%")
-    console.print(f"  Profiles Used: {', '.join(results['profiles_used'])}")
+    console.print(f"\n[bold]Overall Statistics:[/bold]\n"
+                  f"  Total Devices Generated: {results['total_generated']}\n"
+                  f"  Total Valid Devices: {results['total_valid']}\n"
+                  f"  Success Rate: {results['success_rate']:.1f}%\n"
+                  f"  Profiles Used: {', '.join(results['profiles_used'])}")
 
 def display_infrastructure_results(results: dict):
     """Display comprehensive infrastructure results"""
+    console = get_console()
     console.print(f"\n[bold]Infrastructure Generation Results[/bold]")
     
-    summary_table = Table(title="Infrastructure Components", show_header=True, header_style="bold blue")
-    summary_table.add_column("Component", style="cyan")
-    summary_table.add_column("Type", style="white")
-    summary_table.add_column("Count", style="yellow")
-    summary_table.add_column("Status", style="green")
-    
-    for component, data in results['infrastructure'].items():
-        status = f"✓ {data['count']} generated"
-        summary_table.add_row(
-            component.replace('_', ' ').title(),
-            data['type'],
-            str(data['count']),
-            status
-        )
-    
-    console.print(summary_table)
+    render(build_infrastructure_table, results)
     
     # Overall statistics
-    console.print(f"\n[bold]Overall Statistics:[/bold]")
-    console.print(f"  Total Devices: {results['total_devices']}")
-    console.print(f"  Valid Devices: {results['total_valid']}")
-    console.print(f"  Success Rate: {(results['total_valid']/results['total_devices']*100):.1f}%")
-    console.print(f"  Profile Used: {results['profile_used'] or 'Auto-selected'}")
+    console.print(f"\n[bold]Overall Statistics:[/bold]\n"
+                  f"  Total Devices: {results['total_devices']}\n"
+                  f"  Valid Devices: {results['total_valid']}\n"
+                  f"  Success Rate: {results['success_rate']:.1f}%\n"
+                  f"  Profile Used: {results['profile_used'] or 'Auto-selected'}")
 
 def fallback_storage_demo(simulation_engine):
     """Fallback storage demo if scenario fails"""
+    console = get_console()
     console.print("Generating sample storage devices...")
-    
-    # Generate sample devices manually
-    sample_devices = [
-        {
-            "@odata.type": "#StorageController.v1_0_0.StorageController",
-            "@odata.id": "/redfish/v1/Storage/1/Controllers/1",
-            "Id": "1",
-            "Name": "Storage Controller 1",
-            "Status": {"State": "Enabled", "Health": "OK"},
-            "Manufacturer": "Digital Twin Corp",
-            "Model": "DT-SC-3000",
-            "SerialNumber": "2M220100SL"
-        },
-        {
-            "@odata.type": "#Drive.v1_0_0.Drive",
-            "@odata.id": "/redfish/v1/Storage/1/Drives/1",
-            "Id": "1",
-            "Name": "Drive 1",
-            "Status": {"State": "Enabled", "Health": "OK"},
-            "CapacityBytes": 1000000000000,
-            "Protocol": "NVMe"
-        }
-    ]
-    
-    console.print(f"[green]✓[/green] Generated {len(sample_devices)} sample storage devices")
+    console.print(f"[green]✓[/green] Generated {len(FALLBACK_STORAGE_DEVICES)} sample storage devices")
 
 def fallback_compute_demo(simulation_engine):
     """Fallback compute demo if scenario fails"""
+    console = get_console()
     console.print("Generating sample compute devices...")
-    
-    sample_devices = [
-        {
-            "@odata.type": "#ComputerSystem.v1_19_0.ComputerSystem",
-            "@odata.id": "/redfish/v1/Systems/1",
-            "Id": "1",
-            "Name": "Compute Node 1",
-            "Status": {"State": "Enabled", "Health": "OK"},
-            "Manufacturer": "Digital Twin Corp",
-            "Model": "DT-CS-5000",
-            "SerialNumber": "2M220100SL"
-        }
-    ]
-    
-    console.print(f"[green]✓[/green] Generated {len(sample_devices)} sample compute devices")
+    console.print(f"[green]✓[/green] Generated {len(FALLBACK_COMPUTE_DEVICES)} sample compute devices")
 
 if __name__ == "__main__":
+    from rich.panel import Panel
+
+    console = get_console()
     try:
         console.print(Panel("[bold magenta]AI-Driven Digital Twin - Comprehensive Demo[/bold magenta]\n"
                             "[bold magenta]SNIA SDC 2025 - Rahul Vishwakarma[/bold magenta]\n"
@@ -8,23 +8,67 @@ This application demonstrates how Large Language Models can generate
 Redfish/Swordfish compliant device simulations using official DMTF specifications.
 """
 
+import atexit
+import importlib.util
+import os
 import sys
-import time
-from pathlib import Path
+from functools import cached_property
+from types import MappingProxyType
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.table import Table
-from rich.tree import Tree
-from rich import box
-from config import Config
-from src import PromptProcessor, SimulationEngine, RecordingGenerator, ResponseValidator
+from config import get_config, pace
 
-console = Console()
+# The src package pulls in LangChain, the OpenAI SDK and jsonschema, so its
+# components are imported and built on first use rather than at startup.
+
+# Connection pool sizes for the shared Azure OpenAI HTTP clients
+HTTP_KEEPALIVE_CONNECTIONS = 32
+HTTP_MAX_CONNECTIONS = 64
+
+# Highlighting is off: output is mostly static markup, and auto-highlighting re-scans every print
+console = Console(highlight=False)
+
+# Column layouts for the menu tables: title, header style, then (header, column options) pairs
+TABLE_TEMPLATES = MappingProxyType({
+    'scenarios': ("Available Demo Scenarios for SNIA SDC 2025", "bold magenta", (
+        ("Key", {'style': "cyan", 'no_wrap': True}),
+        ("Name", {'style': "white"}),
+        ("Focus Areas", {'style': "green"}),
+        ("Target Score", {'style': "yellow"}),
+        ("Devices", {'style': "blue"})
+    )),
+    'scenario_summary': ("Generation Summary", "bold green", (
+        ("Resource Type", {'style': "cyan"}),
+        ("Count", {'style': "white"}),
+        ("Profile", {'style': "yellow"}),
+        ("Status", {'style': "green"})
+    )),
+    'infrastructure_summary': ("Infrastructure Components", "bold blue", (
+        ("Component", {'style': "cyan"}),
+        ("Type", {'style': "white"}),
+        ("Count", {'style': "yellow"}),
+        ("Status", {'style': "green"})
+    )),
+    'benefits': ("AI-Driven Digital Twin Benefits", "bold cyan", (
+        ("Capability", {'style': "yellow"}),
+        ("Traditional Approach", {'style': "red"}),
+        ("AI-Driven Digital Twin", {'style': "green"})
+    ))
+})
+
+def make_table(name: str) -> Table:
+    """Return a fresh, empty table laid out from TABLE_TEMPLATES"""
+    title, header_style, columns = TABLE_TEMPLATES[name]
+    table = Table(title=title, show_header=True, header_style=header_style)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
 
 class DigitalTwinApp:
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.console = console
         
         # Check Azure OpenAI API key
@@ -39,16 +83,60 @@ class DigitalTwinApp:
             self.console.print("[red]Error: AZURE_OPENAI_ENDPOINT not found in .env file[/red]")
             self.console.print("Please add your Azure OpenAI endpoint to the .env file")
             sys.exit(1)
-        
-        # Initialize components
-        self.prompt_processor = PromptProcessor(self.config)
-        self.validator = ResponseValidator(self.config)
-        self.simulation_engine = SimulationEngine(
+    
+    @cached_property
+    def prompt_processor(self):
+        from src import PromptProcessor
+        return PromptProcessor(self.config)
+    
+    @cached_property
+    def validator(self):
+        from src import ResponseValidator
+        return ResponseValidator(self.config)
+    
+    @cached_property
+    def _http_clients(self):
+        """Shared keep-alive HTTP clients for every Azure OpenAI call the app makes"""
+        import httpx
+
+        limits = httpx.Limits(max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS, max_connections=HTTP_MAX_CONNECTIONS)
+        # HTTP/2 multiplexes concurrent requests over one connection; httpx needs the optional h2 package for it
+        http2 = importlib.util.find_spec('h2') is not None
+        clients = (httpx.Client(limits=limits, http2=http2), httpx.AsyncClient(limits=limits, http2=http2))
+        atexit.register(self._close_http_clients)
+        return clients
+    
+    def _close_http_clients(self):
+        http_client, http_async_client = self._http_clients
+        http_client.close()
+        engine = self.__dict__.get('simulation_engine')
+        if engine is not None:
+            # the async client's connections belong to the engine's event loop
+            engine.run(http_async_client.aclose())
+            engine.close()
+    
+    @cached_property
+    def simulation_engine(self):
+        from src import SimulationEngine
+        http_client, http_async_client = self._http_clients
+        return SimulationEngine(
             self.config, 
             self.prompt_processor, 
-            self.validator
+            self.validator,
+            http_client=http_client,
+            http_async_client=http_async_client,
+            quiet=self.config.DEMO_MODE == 'automated'
         )
-        self.recording_generator = RecordingGenerator(self.config)
+    
+    @cached_property
+    def recording_generator(self):
+        from src import RecordingGenerator
+        return RecordingGenerator(self.config)
+    
+    @cached_property
+    def available_profiles(self):
+        # Mockups are loaded once per processor, so the profile list is fixed for the session
+        return self.prompt_processor.get_available_profiles()
     
     def run(self):
         """Main application loop"""
@@ -81,6 +169,10 @@ class DigitalTwinApp:
     
     def display_welcome(self):
         """Display welcome message"""
+        self.console.print(self._welcome_panel)
+    
+    @cached_property
+    def _welcome_panel(self) -> Panel:
         welcome_text = f"""
         [bold cyan]AI-Driven Digital Twin for Storage Devices[/bold cyan]
         [dim]SNIA SDC 2025 - Demonstration Application[/dim]
@@ -100,7 +192,7 @@ class DigitalTwinApp:
         • Automated demo scenarios
         • Real-time infrastructure simulation
         """
-        self.console.print(Panel(welcome_text, title="Welcome", border_style="cyan"))
+        return Panel(self.console.render_str(welcome_text), title="Welcome", border_style="cyan")
     
     def show_menu(self) -> str:
         """Display main menu"""
@@ -124,26 +216,20 @@ class DigitalTwinApp:
         self.console.print("\n[bold]Demo Scenarios[/bold]")
         
         # Display enhanced demo scenarios for SNIA SDC 2025
-        table = Table(title="Available Demo Scenarios for SNIA SDC 2025", show_header=True, header_style="bold magenta")
-        table.add_column("Key", style="cyan", no_wrap=True)
-        table.add_column("Name", style="white")
-        table.add_column("Focus Areas", style="green")
-        table.add_column("Target Score", style="yellow")
-        table.add_column("Devices", style="blue")
-        
-        for key, scenario in self.config.DEMO_SCENARIOS.items():
-            focus_areas = ", ".join(scenario.get('focus_areas', [])[:2]) + ("..." if len(scenario.get('focus_areas', [])) > 2 else "")
-            target_score = scenario.get('target_score', 'N/A')
-            devices_str = ", ".join(scenario['devices'][:3]) + ("..." if len(scenario['devices']) > 3 else "")
-            table.add_row(key, scenario['name'], focus_areas, str(target_score), devices_str)
+        table = make_table('scenarios')
+        
+        rows = self.config.DEMO_SCENARIO_ROWS
+        for row in rows:
+            table.add_row(*row)
         
         self.console.print(table)
         
         # Select scenario
-        choice = Prompt.ask("Select scenario to run", choices=list(self.config.DEMO_SCENARIOS.keys()))
+        choice = Prompt.ask("Select scenario to run", choices=[row[0] for row in rows])
         
-        if choice in self.config.DEMO_SCENARIOS:
-            self.console.print(f"\n[cyan]Running {self.config.DEMO_SCENARIOS[choice]['name']}...[/cyan]")
+        scenario = self.config.get_demo_scenario(choice)
+        if scenario is not None:
+            self.console.print(f"\n[cyan]Running {scenario['name']}...[/cyan]")
             
             try:
                 results = self.simulation_engine.run_demo_scenario(choice)
@@ -161,11 +247,7 @@ class DigitalTwinApp:
         """Display results from a demo scenario"""
         self.console.print(f"\n[bold]Scenario Results: {results['scenario']}[/bold]")
         
-        summary_table = Table(title="Generation Summary", show_header=True, header_style="bold green")
-        summary_table.add_column("Resource Type", style="cyan")
-        summary_table.add_column("Count", style="white")
-        summary_table.add_column("Profile", style="yellow")
-        summary_table.add_column("Status", style="green")
+        summary_table = make_table('scenario_summary')
         
         for resource_type, data in results['devices'].items():
             status = f"✓ {data['count']} generated"
@@ -182,23 +264,16 @@ class DigitalTwinApp:
         self.console.print(f"\n[bold]Overall Statistics:[/bold]")
         self.console.print(f"  Total Devices Generated: {results['total_generated']}")
         self.console.print(f"  Total Valid Devices: {results['total_valid']}")
-        self.console.print(f"  Success Rate: {(results['total_valid']/results['total_generated']*100):.1f}%")
+        self.console.print(f"  Success Rate: {results['success_rate']:.1f}%")
         self.console.print(f"  Profiles Used: {', '.join(results['profiles_used'])}")
     
     def _generate_scenario_recording(self, results: dict):
         """Generate recording for a demo scenario"""
-        all_devices = []
-        device_types = []
-        
-        for resource_type, data in results['devices'].items():
-            all_devices.extend(data['devices'])
-            device_types.append(resource_type)
-        
-        if all_devices:
+        if results['all_devices']:
             recording_path = self.recording_generator.generate_recording(
-                all_devices, 
+                results['all_devices'], 
                 f"scenario_{results['scenario']}", 
-                device_types[0] if device_types else "Mixed"
+                results['device_types'][0] if results['device_types'] else "Mixed"
             )
             self.console.print(f"[green]✓[/green] Recording saved to: {recording_path}")
     
@@ -231,7 +306,7 @@ class DigitalTwinApp:
         count = IntPrompt.ask("Number of devices to generate", default=3)
         
         # Profile selection
-        available_profiles = self.prompt_processor.get_available_profiles()
+        available_profiles = self.available_profiles
         if available_profiles:
             self.console.print(f"\nAvailable profiles: {', '.join(available_profiles)}")
             profile = Prompt.ask("Select profile (or press Enter for auto-selection)", 
@@ -244,7 +319,7 @@ class DigitalTwinApp:
         # Generate devices
         self.console.print(f"\n[cyan]Generating {count} {device_type} device(s)...[/cyan]")
         devices = self.simulation_engine.generate_device(
-            device_type, resource_type, count, profile=profile
+            device_type, resource_type, count, profile=profile, stream=True
         )
         
         if devices:
@@ -297,7 +372,7 @@ class DigitalTwinApp:
         self.console.print("\n[bold]Comprehensive Infrastructure Generation[/bold]")
         
         # Profile selection
-        available_profiles = self.prompt_processor.get_available_profiles()
+        available_profiles = self.available_profiles
         if available_profiles:
             self.console.print(f"Available profiles: {', '.join(available_profiles)}")
             profile = Prompt.ask("Select profile (or press Enter for auto-selection)", 
@@ -309,20 +384,18 @@ class DigitalTwinApp:
         
         # Generate infrastructure
         self.console.print("\n[cyan]Generating comprehensive infrastructure...[/cyan]")
-        results = self.simulation_engine.generate_comprehensive_infrastructure(profile=profile)
+        results = self.simulation_engine.generate_comprehensive_infrastructure(
+            profile=profile, use_batch=bool(self.config.AZURE_OPENAI_BATCH_DEPLOYMENT_NAME)
+        )
         
         # Display results
         self._display_infrastructure_results(results)
         
         # Generate recording
         if Confirm.ask("Generate recording for this infrastructure?"):
-            all_devices = []
-            for component_data in results['infrastructure'].values():
-                all_devices.extend(component_data['devices'])
-            
-            if all_devices:
+            if results['all_devices']:
                 recording_path = self.recording_generator.generate_recording(
-                    all_devices, "comprehensive_infrastructure", "Mixed"
+                    results['all_devices'], "comprehensive_infrastructure", "Mixed"
                 )
                 self.console.print(f"[green]✓[/green] Recording saved to: {recording_path}")
     
@@ -330,11 +403,7 @@ class DigitalTwinApp:
         """Display comprehensive infrastructure results"""
         self.console.print(f"\n[bold]Infrastructure Generation Results[/bold]")
         
-        summary_table = Table(title="Infrastructure Components", show_header=True, header_style="bold blue")
-        summary_table.add_column("Component", style="cyan")
-        summary_table.add_column("Type", style="white")
-        summary_table.add_column("Count", style="yellow")
-        summary_table.add_column("Status", style="green")
+        summary_table = make_table('infrastructure_summary')
         
         for component, data in results['infrastructure'].items():
             status = f"✓ {data['count']} generated"
@@ -351,7 +420,7 @@ class DigitalTwinApp:
         self.console.print(f"\n[bold]Overall Statistics:[/bold]")
         self.console.print(f"  Total Devices: {results['total_devices']}")
         self.console.print(f"  Valid Devices: {results['total_valid']}")
-        self.console.print(f"  Success Rate: {(results['total_valid']/results['total_devices']*100):.1f}%")
+        self.console.print(f"  Success Rate: {results['success_rate']:.1f}%")
         self.console.print(f"  Profile Used: {results['profile_used'] or 'Auto-selected'}")
     
     def simulate_operations(self):
@@ -375,7 +444,7 @@ class DigitalTwinApp:
         
         for op in operations:
             if Confirm.ask(f"Simulate {op} operation?"):
-                result = self.simulation_engine.simulate_operation(sample_device.copy(), op)
+                result = self.simulation_engine.simulate_operation(sample_device, op)
                 self.console.print(f"Result: {result.get('Status')}")
     
     def explore_redfish_profiles(self):
@@ -386,7 +455,7 @@ class DigitalTwinApp:
         self.simulation_engine.show_available_profiles()
         
         # Allow user to explore specific profile
-        available_profiles = self.prompt_processor.get_available_profiles()
+        available_profiles = self.available_profiles
         if available_profiles:
             profile = Prompt.ask("Select profile to explore", choices=available_profiles)
             self._explore_specific_profile(profile)
@@ -425,8 +494,12 @@ class DigitalTwinApp:
         """Validate existing recordings"""
         self.console.print("\n[bold]Recording Validation[/bold]")
         
-        recordings_path = Path(self.config.OUTPUT_DIR)
-        recordings = list(recordings_path.glob("*/"))
+        try:
+            # scandir reports entry types from the directory listing, avoiding a stat per recording
+            with os.scandir(self.config.OUTPUT_DIR) as entries:
+                recordings = [entry for entry in entries if entry.is_dir() or entry.name.endswith('.tar')]
+        except FileNotFoundError:
+            recordings = []
         
         if not recordings:
             self.console.print("[yellow]No recordings found[/yellow]")
@@ -442,7 +515,11 @@ class DigitalTwinApp:
     
     def show_architecture(self):
         """Display architecture diagram"""
-        architecture = f"""
+        self.console.print(self._architecture_panel)
+    
+    @cached_property
+    def _architecture_panel(self) -> Panel:
+        architecture = """
         ┌─────────────────────────────────────────────────────────────────────────┐
         │                    DMTF REDFISH 2025.2 SPECIFICATIONS                  │
         │              (Official Mockups from DSP2043_2025.2 Bundle)             │
@@ -485,7 +562,7 @@ class DigitalTwinApp:
         • Real-time validation against official schemas
         • Automated infrastructure generation
         """
-        self.console.print(Panel(architecture, title="System Architecture", border_style="blue"))
+        return Panel(self.console.render_str(architecture), title="System Architecture", border_style="blue")
     
     def run_automated_demo(self):
         """Run automated demo for presentations"""
@@ -498,29 +575,31 @@ class DigitalTwinApp:
     def _run_automated_demo_sequence(self):
         """Run the automated demo sequence"""
         self.console.print("\n[bold cyan]Starting Automated Demo Sequence...[/bold cyan]")
-        time.sleep(1)
+        pace(1)
         
         # Step 1: Show available profiles
         self.console.print("\n[bold]Step 1: Redfish Profile Overview[/bold]")
         self.simulation_engine.show_available_profiles()
-        time.sleep(2)
+        pace(2)
         
         # Step 2: Run enterprise storage scenario
         self.console.print("\n[bold]Step 2: Enterprise Storage Infrastructure Demo[/bold]")
         try:
-            results = self.simulation_engine.run_demo_scenario('enterprise_storage')
+            results = self.simulation_engine.run_demo_scenario(
+                'enterprise_storage', use_batch=bool(self.config.AZURE_OPENAI_BATCH_DEPLOYMENT_NAME)
+            )
             self._display_scenario_results(results)
         except Exception as e:
             self.console.print(f"[red]Demo step failed: {e}[/red]")
             # Fallback to manual generation
             self.console.print("Falling back to manual device generation...")
             self._fallback_storage_demo()
-        time.sleep(2)
+        pace(2)
         
         # Step 3: Show architecture
         self.console.print("\n[bold]Step 3: System Architecture[/bold]")
         self.show_architecture()
-        time.sleep(2)
+        pace(2)
         
         # Step 4: Benefits summary
         self.console.print("\n[bold]Step 4: Benefits Summary[/bold]")
@@ -549,10 +628,7 @@ class DigitalTwinApp:
     
     def _show_benefits_summary(self):
         """Show benefits summary table"""
-        benefits_table = Table(title="AI-Driven Digital Twin Benefits", show_header=True, header_style="bold cyan")
-        benefits_table.add_column("Capability", style="yellow")
-        benefits_table.add_column("Traditional Approach", style="red")
-        benefits_table.add_column("AI-Driven Digital Twin", style="green")
+        benefits_table = make_table('benefits')
         
         benefits = [
             ("Hardware Required", "Physical devices needed", "Zero hardware dependency"),
@@ -1,16 +1,188 @@
+import copy
 import json
 import os
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from langchain.prompts import PromptTemplate
 from langchain.prompts.few_shot import FewShotPromptTemplate
 from pathlib import Path
+from types import MappingProxyType
 import random
+from . import serialization
+
+# Template files merged by _load_templates: (TEMPLATE_FILES key, label for warnings).
+# device_prompts is also flattened into the top level, so it must come first.
+TEMPLATE_SOURCES = (
+    ('device_prompts', 'device prompts'),
+    ('demo_scenarios', 'demo scenarios'),
+    ('presentation_templates', 'presentation templates'),
+    ('quality_metrics', 'quality metrics'),
+    ('enterprise_features', 'enterprise features')
+)
+
+# Built-in prompt templates used when no template file could be loaded
+DEFAULT_TEMPLATES = MappingProxyType({
+    "base_prompt": """You are an expert in DMTF Redfish standards and SNIA Swordfish extensions.
+Generate a JSON response for a {device_type} that strictly adheres to Redfish specification v{schema_version}.
+
+Context:
+{context}
+
+Requirements:
+1. Must be valid JSON
+2. Must include all required Redfish properties
+3. Must use correct data types as per schema
+4. Must include realistic values
+5. Must follow Redfish naming conventions
+6. Must include proper @odata.type and @odata.id values
+
+Example structure from official Redfish mockup:
+{example_structure}
+
+Generate a complete JSON response for the {resource_type} resource that follows the exact format above:""",
+
+    "validation_prompt": """Validate the following JSON against Redfish schema requirements:
+{json_data}
+
+Check for:
+1. Required properties presence
+2. Data type correctness
+3. Value range validity
+4. Schema compliance
+5. Redfish naming conventions
+
+Return validation result as JSON with 'valid' boolean and 'errors' array.""",
+
+    "collection_prompt": """Generate a Redfish collection response for {resource_type} containing {count} members.
+
+The collection must follow the standard Redfish collection format with:
+- @odata.type for collection
+- Members array with @odata.id references
+- Members@odata.count property
+- Proper Redfish versioning
+
+Example collection structure:
+{example_collection}
+
+Generate the collection JSON:""",
+
+    "enhanced_prompt": """As a Redfish/Swordfish expert, create a detailed {device_type} with the following specifications:
+
+Manufacturer: {manufacturer}
+Capacity: {capacity}
+Protocol: {protocol}
+Health Status: {health}
+Location: {location}
+
+Ensure all properties follow Redfish v{schema_version} standards.
+Include both required and commonly used optional properties.
+Use realistic values based on enterprise hardware specifications.
+
+Reference Redfish mockup example:
+{example_structure}
+
+Generate complete JSON response:"""
+})
+
+# Built-in example structures for resource types without a mockup match; copy before modifying
+FALLBACK_EXAMPLES = MappingProxyType({
+    "StorageController": {
+        "@odata.type": "#StorageController.v1_0_0.StorageController",
+        "@odata.id": "/redfish/v1/Storage/1/Controllers/1",
+        "Id": "1",
+        "Name": "Storage Controller",
+        "Status": {
+            "State": "Enabled",
+            "Health": "OK"
+        },
+        "Manufacturer": "Example Corp",
+        "Model": "SC-3000",
+        "SerialNumber": "2M220100SL"
+    },
+    "Drive": {
+        "@odata.type": "#Drive.v1_0_0.Drive",
+        "@odata.id": "/redfish/v1/Storage/1/Drives/1",
+        "Id": "1",
+        "Name": "Drive 1",
+        "Status": {
+            "State": "Enabled",
+            "Health": "OK"
+        },
+        "CapacityBytes": 1000000000000,
+        "Protocol": "SAS"
+    },
+    "ComputerSystem": {
+        "@odata.type": "#ComputerSystem.v1_19_0.ComputerSystem",
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Id": "1",
+        "Name": "Compute Node 1",
+        "Status": {
+            "State": "Enabled",
+            "Health": "OK"
+        },
+        "Manufacturer": "Example Corp",
+        "Model": "CS-5000",
+        "SerialNumber": "2M220100SL"
+    }
+})
+
+# Input variables for each prompt template used by the create_*_prompt methods
+PROMPT_VARIABLES = {
+    'base_prompt': ["device_type", "resource_type", "schema_version", "context", "example_structure"],
+    'validation_prompt': ["json_data"],
+    'collection_prompt': ["resource_type", "count", "example_collection"],
+    'enhanced_prompt': ["device_type", "resource_type", "schema_version",
+                        "manufacturer", "capacity", "protocol", "health", "location",
+                        "example_structure"]
+}
+
+def _read_json_file(path: Path):
+    """Return (data, error) for a JSON file; data is None when the file doesn't exist"""
+    try:
+        return (serialization.loads(path.read_bytes()) if path.exists() else None), None
+    except Exception as e:
+        return None, e
+
+class LazyMapping(Mapping):
+    """Read-only mapping over a fixed set of keys whose values are loaded on first access"""
+    
+    def __init__(self, keys: Iterable[str], loader: Callable[[str], Any]):
+        self._keys = dict.fromkeys(keys)
+        self._loader = loader
+        self._values = {}
+    
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        if key not in self._values:
+            self._values[key] = self._loader(key)
+        return self._values[key]
+    
+    def __contains__(self, key):
+        return key in self._keys
+    
+    def __iter__(self):
+        return iter(self._keys)
+    
+    def __len__(self):
+        return len(self._keys)
 
 class PromptProcessor:
     def __init__(self, config):
         self.config = config
+        # Memoize per instance; lru_cache on the methods themselves would keep every processor alive
+        self._prompt_template = lru_cache(maxsize=None)(self._prompt_template)
+        self._prompt_formatter = lru_cache(maxsize=None)(self._prompt_formatter)
+        self._example_structure_json = lru_cache(maxsize=256)(self._example_structure_json)
+        self._mockup_type_index = lru_cache(maxsize=None)(self._mockup_type_index)
+        self._static_context = lru_cache(maxsize=256)(self._static_context)
+        self._collection_example_json = lru_cache(maxsize=256)(self._collection_example_json)
         self.templates = self._load_templates()
         self.specifications = self._load_specifications()
+        # Prompts only need per-type property lists, so the raw schema dicts are not kept around
+        self._schema_index = self._build_schema_index(self.specifications.pop('redfish_schemas', {}))
         self.redfish_mockups = self._load_redfish_mockups()
         self.validation_rules = self._load_validation_rules()
         
@@ -18,52 +190,18 @@ class PromptProcessor:
         """Load enhanced prompt templates from JSON files"""
         templates = {}
         
-        # Load device prompts
-        device_prompts_path = Path(self.config.TEMPLATE_FILES.get('device_prompts', 'templates/device_prompts.json'))
-        if device_prompts_path.exists():
-            try:
-                with open(device_prompts_path, 'r') as f:
-                    device_prompts = json.load(f)
-                    templates.update(device_prompts)
-                    templates['device_prompts'] = device_prompts  # Keep reference to device prompts
-            except Exception as e:
-                print(f"Warning: Could not load device prompts: {e}")
-        
-        # Load demo scenarios
-        demo_scenarios_path = Path(self.config.TEMPLATE_FILES.get('demo_scenarios', 'templates/demo_scenarios.json'))
-        if demo_scenarios_path.exists():
-            try:
-                with open(demo_scenarios_path, 'r') as f:
-                    templates['demo_scenarios'] = json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load demo scenarios: {e}")
-        
-        # Load presentation templates
-        presentation_path = Path(self.config.TEMPLATE_FILES.get('presentation_templates', 'templates/presentation_templates.json'))
-        if presentation_path.exists():
-            try:
-                with open(presentation_path, 'r') as f:
-                    templates['presentation_templates'] = json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load presentation templates: {e}")
+        # The files are independent, so read them concurrently; results come back in TEMPLATE_SOURCES order
+        paths = [self.config.TEMPLATE_FILES[key] for key, _ in TEMPLATE_SOURCES]
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            loaded = list(executor.map(_read_json_file, paths))
         
-        # Load quality metrics
-        quality_path = Path(self.config.TEMPLATE_FILES.get('quality_metrics', 'templates/quality_metrics.json'))
-        if quality_path.exists():
-            try:
-                with open(quality_path, 'r') as f:
-                    templates['quality_metrics'] = json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load quality metrics: {e}")
-        
-        # Load enterprise features
-        enterprise_path = Path(self.config.TEMPLATE_FILES.get('enterprise_features', 'templates/enterprise_features.json'))
-        if enterprise_path.exists():
-            try:
-                with open(enterprise_path, 'r') as f:
-                    templates['enterprise_features'] = json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load enterprise features: {e}")
+        for (key, label), (data, error) in zip(TEMPLATE_SOURCES, loaded):
+            if error is not None:
+                print(f"Warning: Could not load {label}: {error}")
+            elif data is not None:
+                if key == 'device_prompts':
+                    templates.update(data)
+                templates[key] = data  # Keep reference to device prompts
         
         if not templates:
             return self._get_default_templates()
@@ -73,34 +211,46 @@ class PromptProcessor:
     def _load_specifications(self) -> Dict:
         """Load Redfish/Swordfish specifications"""
         specs = {}
-        specs_dir = Path(self.config.SPECS_DIR)
-        for spec_file in specs_dir.glob('*.json'):
-            with open(spec_file, 'r') as f:
-                specs[spec_file.stem] = json.load(f)
+        if not os.path.isdir(self.config.SPECS_DIR):
+            return specs
+        # Single directory read; scandir's dirent type avoids a stat per file
+        with os.scandir(self.config.SPECS_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    specs[entry.name[:-5]] = serialization.read_json(entry.path)
         return specs
     
-    def _load_redfish_mockups(self) -> Dict:
-        """Load official Redfish mockups from DSP2043_2025.2"""
-        mockups = {}
+    def _build_schema_index(self, schemas: Dict) -> Dict[str, Tuple[List[str], List[str], Dict[str, str]]]:
+        """Index schema properties per resource type as (required, optional, property types)"""
+        index = {}
+        for resource_type, schema in schemas.items():
+            required, optional, types = [], [], {}
+            for prop, details in schema.get("properties", {}).items():
+                (required if details.get("required", False) else optional).append(prop)
+                types[prop] = details.get("type", "string")
+            index[resource_type] = (required, optional, types)
+        return index
+    
+    def _load_redfish_mockups(self) -> Mapping[str, Dict]:
+        """Index official Redfish mockups from DSP2043_2025.2; each profile is read on first access"""
         mockups_dir = Path(self.config.REDFISH_MOCKUPS_DIR)
         
-        if not mockups_dir.exists():
-            return mockups
-            
-        for profile in self.config.REDFISH_PROFILES:
-            profile_path = mockups_dir / profile
-            if profile_path.exists():
-                mockups[profile] = self._extract_profile_info(profile_path)
+        # One directory read instead of an exists() stat per configured profile
+        try:
+            with os.scandir(mockups_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            return {}
         
-        return mockups
+        profiles = [profile for profile in self.config.REDFISH_PROFILES if profile in present]
+        return LazyMapping(profiles, lambda profile: self._extract_profile_info(mockups_dir / profile))
 
     def _load_validation_rules(self) -> Dict:
         """Load validation rules to expose required fields into prompt context"""
         try:
-            rules_path = Path(self.config.TEMPLATE_FILES.get('validation_rules', 'templates/validation_rules.json'))
+            rules_path = self.config.TEMPLATE_FILES['validation_rules']
             if rules_path.exists():
-                with open(rules_path, 'r') as f:
-                    return json.load(f)
+                return serialization.loads(rules_path.read_bytes())
         except Exception:
             pass
         return {}
@@ -116,8 +266,7 @@ class PromptProcessor:
         # Load main index
         index_file = profile_path / 'index.json'
         if index_file.exists():
-            with open(index_file, 'r') as f:
-                profile_info['index'] = json.load(f)
+            profile_info['index'] = serialization.loads(index_file.read_bytes())
         
         # Extract resource examples
         for resource_dir in ['Systems', 'Chassis', 'Managers', 'Storage']:
@@ -127,194 +276,121 @@ class PromptProcessor:
         
         return profile_info
     
-    def _extract_resource_examples(self, resource_path: Path) -> Dict:
-        """Extract examples from a resource directory"""
-        examples = {}
+    def _extract_resource_examples(self, resource_path: Path) -> Mapping[str, Dict]:
+        """Index examples in a resource directory; each index.json is parsed on first access"""
+        files = {}
         
         # Look for index.json files
         index_file = resource_path / 'index.json'
         if index_file.exists():
-            with open(index_file, 'r') as f:
-                examples['collection'] = json.load(f)
+            files['collection'] = index_file
         
         # Look for individual resource examples
         for item_dir in resource_path.iterdir():
             if item_dir.is_dir() and not item_dir.name.startswith('$'):
                 item_index = item_dir / 'index.json'
                 if item_index.exists():
-                    with open(item_index, 'r') as f:
-                        examples[item_dir.name] = json.load(f)
+                    files[item_dir.name] = item_index
         
-        return examples
+        return LazyMapping(files, lambda name: serialization.loads(files[name].read_bytes()))
     
-    def _get_default_templates(self) -> Dict:
+    def _get_default_templates(self) -> Mapping[str, str]:
         """Default prompt templates for device generation"""
-        return {
-            "base_prompt": """You are an expert in DMTF Redfish standards and SNIA Swordfish extensions.
-Generate a JSON response for a {device_type} that strictly adheres to Redfish specification v{schema_version}.
-
-Context:
-{context}
-
-Requirements:
-1. Must be valid JSON
-2. Must include all required Redfish properties
-3. Must use correct data types as per schema
-4. Must include realistic values
-5. Must follow Redfish naming conventions
-6. Must include proper @odata.type and @odata.id values
-
-Example structure from official Redfish mockup:
-{example_structure}
-
-Generate a complete JSON response for the {resource_type} resource that follows the exact format above:""",
-
-            "validation_prompt": """Validate the following JSON against Redfish schema requirements:
-{json_data}
-
-Check for:
-1. Required properties presence
-2. Data type correctness
-3. Value range validity
-4. Schema compliance
-5. Redfish naming conventions
-
-Return validation result as JSON with 'valid' boolean and 'errors' array.""",
-
-            "collection_prompt": """Generate a Redfish collection response for {resource_type} containing {count} members.
-
-The collection must follow the standard Redfish collection format with:
-- @odata.type for collection
-- Members array with @odata.id references
-- Members@odata.count property
-- Proper Redfish versioning
-
-Example collection structure:
-{example_collection}
-
-Generate the collection JSON:""",
-
-            "enhanced_prompt": """As a Redfish/Swordfish expert, create a detailed {device_type} with the following specifications:
-
-Manufacturer: {manufacturer}
-Capacity: {capacity}
-Protocol: {protocol}
-Health Status: {health}
-Location: {location}
-
-Ensure all properties follow Redfish v{schema_version} standards.
-Include both required and commonly used optional properties.
-Use realistic values based on enterprise hardware specifications.
-
-Reference Redfish mockup example:
-{example_structure}
-
-Generate complete JSON response:"""
-        }
+        return DEFAULT_TEMPLATES
+    
+    def _prompt_template(self, name: str) -> PromptTemplate:
+        """PromptTemplate for a named template, parsed once and reused across calls"""
+        return PromptTemplate(input_variables=PROMPT_VARIABLES[name], template=self.templates.get(name))
+    
+    def _prompt_formatter(self, name: str) -> Callable[..., str]:
+        """Format function for a named template; plain f-string templates skip LangChain's per-call overhead"""
+        template = self._prompt_template(name)
+        if template.template_format == 'f-string' and not template.partial_variables:
+            # Same substitution as PromptTemplate.format, done by the C-level str.format
+            return template.template.format
+        return template.format
     
     def create_device_prompt(self, device_type: str, resource_type: str, 
                            context: Dict = None, profile: str = None) -> str:
         """Create a prompt for generating a specific device type"""
-        template = PromptTemplate(
-            input_variables=["device_type", "resource_type", "schema_version", 
-                           "context", "example_structure"],
-            template=self.templates.get("base_prompt")
-        )
-        
-        # Get example structure from official mockups if available
-        example_structure = self._get_example_structure(resource_type, profile)
+        format_prompt = self._prompt_formatter("base_prompt")
         
         # Build enhanced context from specifications and mockups
         spec_context = self._build_enhanced_context(device_type, resource_type, profile)
         if context:
             spec_context.update(context)
         
-        return template.format(
+        return format_prompt(
             device_type=device_type,
             resource_type=resource_type,
             schema_version=self.config.SCHEMA_VERSION,
             context=json.dumps(spec_context, indent=2),
-            example_structure=json.dumps(example_structure, indent=2)
+            example_structure=self._example_structure_json(resource_type, profile)
         )
     
+    def create_batch_device_prompt(self, device_type: str, resource_type: str, count: int,
+                                   context: Dict = None, profile: str = None) -> str:
+        """Create a prompt for generating count distinct instances of a device type in one reply"""
+        return self.create_device_prompt(device_type, resource_type, context, profile) + (
+            f"\n\nReturn a JSON object of the form {{\"devices\": [...]}} containing exactly {count} "
+            f"distinct {resource_type} objects, with Id values 1 to {count}."
+        )
+    
+    def _example_structure_json(self, resource_type: str, profile: str = None) -> str:
+        """Pretty-printed example structure, serialized once per (resource_type, profile)"""
+        return json.dumps(self._get_example_structure(resource_type, profile), indent=2)
+    
+    def _mockup_type_index(self, profile: str):
+        """Index a profile's mockup resources by type name and by full @odata.type (lowercased, first wins)"""
+        by_name, by_odata_type = {}, {}
+        for resources in self.redfish_mockups[profile].get('resources', {}).values():
+            for resource_name, resource_data in resources.items():
+                if resource_name != 'collection' and isinstance(resource_data, dict):
+                    odata_type = resource_data.get('@odata.type', '').lower()
+                    by_odata_type.setdefault(odata_type, resource_data)
+                    by_name.setdefault(odata_type.split('.')[0].lstrip('#'), resource_data)
+        return by_name, by_odata_type
+    
     def _get_example_structure(self, resource_type: str, profile: str = None) -> Dict:
         """Get example structure from official Redfish mockups"""
         # Try to find in specified profile first
         if profile and profile in self.redfish_mockups:
-            profile_data = self.redfish_mockups[profile]
-            for resource_category, resources in profile_data.get('resources', {}).items():
-                for resource_name, resource_data in resources.items():
-                    if resource_name != 'collection' and isinstance(resource_data, dict):
-                        if resource_type.lower() in resource_data.get('@odata.type', '').lower():
-                            return resource_data
+            by_name, by_odata_type = self._mockup_type_index(profile)
+            wanted = resource_type.lower()
+            if wanted in by_name:
+                return by_name[wanted]
+            # No exact type name; fall back to the substring match on @odata.type
+            for odata_type, resource_data in by_odata_type.items():
+                if wanted in odata_type:
+                    return resource_data
         
-        # Fallback to examples directory
-        examples = {
-            "StorageController": {
-                "@odata.type": "#StorageController.v1_0_0.StorageController",
-                "@odata.id": "/redfish/v1/Storage/1/Controllers/1",
-                "Id": "1",
-                "Name": "Storage Controller",
-                "Status": {
-                    "State": "Enabled",
-                    "Health": "OK"
-                },
-                "Manufacturer": "Example Corp",
-                "Model": "SC-3000",
-                "SerialNumber": "2M220100SL"
-            },
-            "Drive": {
-                "@odata.type": "#Drive.v1_0_0.Drive",
-                "@odata.id": "/redfish/v1/Storage/1/Drives/1",
-                "Id": "1",
-                "Name": "Drive 1",
-                "Status": {
-                    "State": "Enabled",
-                    "Health": "OK"
-                },
-                "CapacityBytes": 1000000000000,
-                "Protocol": "SAS"
-            },
-            "ComputerSystem": {
-                "@odata.type": "#ComputerSystem.v1_19_0.ComputerSystem",
-                "@odata.id": "/redfish/v1/Systems/1",
-                "Id": "1",
-                "Name": "Compute Node 1",
-                "Status": {
-                    "State": "Enabled",
-                    "Health": "OK"
-                },
-                "Manufacturer": "Example Corp",
-                "Model": "CS-5000",
-                "SerialNumber": "2M220100SL"
-            }
-        }
-        return examples.get(resource_type, {})
+        # Fallback to built-in examples; callers get a private copy so the module constant can't be mutated
+        return copy.deepcopy(FALLBACK_EXAMPLES.get(resource_type, {}))
     
     def _build_enhanced_context(self, device_type: str, resource_type: str, profile: str = None) -> Dict:
         """Build enhanced context from specifications and mockups"""
+        # The context only depends on its arguments; callers get a shallow copy to extend
+        return dict(self._static_context(device_type, resource_type, profile))
+    
+    def _static_context(self, device_type: str, resource_type: str, profile: str = None) -> Dict:
         context = {
             "device_type": device_type,
             "resource_type": resource_type,
             "redfish_version": self.config.REDFISH_VERSION,
             "schema_version": self.config.SCHEMA_VERSION,
-            "required_properties": self.validation_rules.get('required_fields', {}).get(resource_type, []),
+            "required_properties": list(self.validation_rules.get('required_fields', {}).get(resource_type, [])),
             "optional_properties": [],
             "property_types": {},
             "mockup_profile": profile,
-            "available_profiles": list(self.redfish_mockups.keys())
+            "available_profiles": self.get_available_profiles()
         }
         
         # Extract from specifications if available
-        if "redfish_schemas" in self.specifications:
-            schema = self.specifications["redfish_schemas"].get(resource_type, {})
-            if "properties" in schema:
-                for prop, details in schema["properties"].items():
-                    if details.get("required", False):
-                        context["required_properties"].append(prop)
-                    else:
-                        context["optional_properties"].append(prop)
-                    context["property_types"][prop] = details.get("type", "string")
+        if resource_type in self._schema_index:
+            required, optional, types = self._schema_index[resource_type]
+            context["required_properties"].extend(required)
+            context["optional_properties"].extend(optional)
+            context["property_types"].update(types)
         
         # Add mockup context if profile specified
         if profile and profile in self.redfish_mockups:
@@ -329,27 +405,23 @@ Generate complete JSON response:"""
     
     def create_validation_prompt(self, json_data: Dict) -> str:
         """Create a prompt for validating generated JSON"""
-        template = PromptTemplate(
-            input_variables=["json_data"],
-            template=self.templates.get("validation_prompt")
-        )
-        return template.format(json_data=json.dumps(json_data, indent=2))
+        format_prompt = self._prompt_formatter("validation_prompt")
+        return format_prompt(json_data=serialization.dumps_pretty(json_data).decode())
     
     def create_collection_prompt(self, resource_type: str, count: int, profile: str = None) -> str:
         """Create a prompt for generating Redfish collections"""
-        template = PromptTemplate(
-            input_variables=["resource_type", "count", "example_collection"],
-            template=self.templates.get("collection_prompt")
-        )
-        
-        example_collection = self._get_collection_example(resource_type, profile)
+        format_prompt = self._prompt_formatter("collection_prompt")
         
-        return template.format(
+        return format_prompt(
             resource_type=resource_type,
             count=count,
-            example_collection=json.dumps(example_collection, indent=2)
+            example_collection=self._collection_example_json(resource_type, profile)
         )
     
+    def _collection_example_json(self, resource_type: str, profile: str = None) -> str:
+        """Pretty-printed collection example, serialized once per (resource_type, profile)"""
+        return json.dumps(self._get_collection_example(resource_type, profile), indent=2)
+    
     def _get_collection_example(self, resource_type: str, profile: str = None) -> Dict:
         """Get collection example from mockups"""
         if profile and profile in self.redfish_mockups:
@@ -373,9 +445,14 @@ Generate complete JSON response:"""
             ]
         }
     
+    @cached_property
+    def _available_profiles(self) -> tuple:
+        """Profile names, computed once since mockups are fixed after load"""
+        return tuple(self.redfish_mockups)
+    
     def get_available_profiles(self) -> List[str]:
         """Get list of available Redfish profiles"""
-        return list(self.redfish_mockups.keys())
+        return list(self._available_profiles)
     
     def get_profile_resources(self, profile: str) -> Dict:
         """Get available resources for a specific profile"""
@@ -386,16 +463,9 @@ Generate complete JSON response:"""
     def create_enhanced_prompt(self, device_type: str, resource_type: str, 
                              specifications: Dict, profile: str = None) -> str:
         """Create an enhanced prompt with specific device specifications"""
-        template = PromptTemplate(
-            input_variables=["device_type", "resource_type", "schema_version", 
-                           "manufacturer", "capacity", "protocol", "health", "location",
-                           "example_structure"],
-            template=self.templates.get("enhanced_prompt")
-        )
-        
-        example_structure = self._get_example_structure(resource_type, profile)
+        format_prompt = self._prompt_formatter("enhanced_prompt")
         
-        return template.format(
+        return format_prompt(
             device_type=device_type,
             resource_type=resource_type,
             schema_version=self.config.SCHEMA_VERSION,
@@ -404,5 +474,5 @@ Generate complete JSON response:"""
             protocol=specifications.get('protocol', 'NVMe'),
             health=specifications.get('health', 'OK'),
             location=specifications.get('location', 'Rack 1, Slot 1'),
-            example_structure=json.dumps(example_structure, indent=2)
+            example_structure=self._example_structure_json(resource_type, profile)
         )
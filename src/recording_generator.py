@@ -1,9 +1,23 @@
-import json
+import io
+import os
+import tarfile
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List
 from rich.console import Console
 from rich.tree import Tree
+from .serialization import dumps_pretty, write_json
+
+# Collection location under /redfish/v1 per resource type; anything else gets /redfish/v1/<resource_type>
+COLLECTION_PATHS = MappingProxyType({
+    'StorageController': 'Storage/1/Controllers',
+    'Drive': 'Storage/1/Drives',
+    'Volume': 'Storage/1/Volumes',
+    'Chassis': 'Chassis',
+    # Store StoragePools under the Storage service for consistency with other resources
+    'StoragePool': 'Storage/1/StoragePools'
+})
 
 class RecordingGenerator:
     def __init__(self, config):
@@ -13,65 +27,99 @@ class RecordingGenerator:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def generate_recording(self, devices: List[Dict], device_type: str, resource_type: str) -> str:
-        ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        ts = now.strftime('%Y%m%d_%H%M%S')
         base = self.output_dir / f'{device_type}_{resource_type}_{ts}'
+        if self.config.RECORDING_FORMAT == 'tar':
+            path = self._write_tar(base, devices, device_type, resource_type, now)
+            self.console.print(f'[green]✓[/green] Recording generated: {path}')
+            return str(path)
         self._create_structure(base, devices, resource_type)
-        (base / 'metadata.json').write_text(json.dumps(self._metadata(devices, device_type, resource_type), indent=2))
-        (base / 'index.json').write_text(json.dumps(self._index(devices, resource_type), indent=2))
+        write_json(base / 'metadata.json', self._metadata(devices, device_type, resource_type, now))
+        write_json(base / 'index.json', self._index(devices, resource_type))
         self.console.print(f'[green]✓[/green] Recording generated: {base}')
         self._show_tree(base)
         return str(base)
 
-    def _create_structure(self, base: Path, devices: List[Dict], resource_type: str):
-        rf = base / 'redfish' / 'v1'
-        rf.mkdir(parents=True, exist_ok=True)
-
-        if resource_type == 'StorageController':
-            col = rf / 'Storage' / '1' / 'Controllers'
-        elif resource_type == 'Drive':
-            col = rf / 'Storage' / '1' / 'Drives'
-        elif resource_type == 'Volume':
-            col = rf / 'Storage' / '1' / 'Volumes'
-        elif resource_type == 'Chassis':
-            col = rf / 'Chassis'
-        elif resource_type == 'StoragePool':
-            # Store StoragePools under the Storage service for consistency with other resources
-            col = rf / 'Storage' / '1' / 'StoragePools'
-        else:
-            col = rf / resource_type
-        col.mkdir(parents=True, exist_ok=True)
+    def _collection_path(self, resource_type: str) -> str:
+        """Collection location relative to /redfish/v1 for a resource type"""
+        return COLLECTION_PATHS.get(resource_type, resource_type)
 
-        collection = {
+    def _collection(self, devices: List[Dict], resource_type: str, col_rel: str) -> Dict:
+        """Assign member @odata.id values and build the collection resource"""
+        members = [{'@odata.id': f'/redfish/v1/{col_rel}/{i}'} for i in range(1, len(devices) + 1)]
+        for d, member in zip(devices, members):
+            d['@odata.id'] = member['@odata.id']
+        return {
             '@odata.type': f'#{resource_type}Collection.{resource_type}Collection',
-            '@odata.id': f'/redfish/v1/{col.relative_to(rf)}',
+            '@odata.id': f'/redfish/v1/{col_rel}',
             'Name': f'{resource_type} Collection',
             'Members@odata.count': len(devices),
-            'Members': []
+            'Members': members
         }
 
+    def _create_structure(self, base: Path, devices: List[Dict], resource_type: str):
+        col_rel = self._collection_path(resource_type)
+        col = base / 'redfish' / 'v1' / col_rel
+        col.mkdir(parents=True, exist_ok=True)
+        collection = self._collection(devices, resource_type, col_rel)
+
+        # The collection directory exists now, so each member needs a single mkdir with plain string paths
+        col_str = str(col)
         for i, d in enumerate(devices, 1):
-            dp = col / str(i)
-            dp.mkdir(exist_ok=True)
-            d['@odata.id'] = f'/redfish/v1/{dp.relative_to(rf)}'
-            (dp / 'index.json').write_text(json.dumps(d, indent=2))
-            collection['Members'].append({'@odata.id': d['@odata.id']})
+            dp_str = f'{col_str}/{i}'
+            try:
+                os.mkdir(dp_str)
+            except FileExistsError:
+                pass
+            write_json(f'{dp_str}/index.json', d)
+
+        write_json(col / 'index.json', collection)
+
+    def _write_tar(self, base: Path, devices: List[Dict], device_type: str, resource_type: str, now: datetime) -> Path:
+        """Write the recording as one tar archive with the same layout as the directory format"""
+        col_rel = self._collection_path(resource_type)
+        collection = self._collection(devices, resource_type, col_rel)
+        path = base.parent / f'{base.name}.tar'
+        prefix = f'{base.name}/redfish/v1/{col_rel}'
+        mtime = now.timestamp()
+
+        def add(tar, name: str, obj):
+            buf = dumps_pretty(obj)
+            info = tarfile.TarInfo(name)
+            info.size, info.mtime = len(buf), mtime
+            tar.addfile(info, io.BytesIO(buf))
 
-        (col / 'index.json').write_text(json.dumps(collection, indent=2))
+        with tarfile.open(path, 'w') as tar:
+            for i, d in enumerate(devices, 1):
+                add(tar, f'{prefix}/{i}/index.json', d)
+            add(tar, f'{prefix}/index.json', collection)
+            add(tar, f'{base.name}/metadata.json', self._metadata(devices, device_type, resource_type, now))
+            add(tar, f'{base.name}/index.json', self._index(devices, resource_type))
+        return path
 
-    def _metadata(self, devices: List[Dict], device_type: str, resource_type: str) -> Dict:
+    def _metadata(self, devices: List[Dict], device_type: str, resource_type: str, now: datetime) -> Dict:
+        total = len(devices)
+        healthy = enabled = 0
+        for d in devices:
+            status = d.get('Status', {})
+            if status.get('Health') == 'OK':
+                healthy += 1
+            if status.get('State') == 'Enabled':
+                enabled += 1
         return {
             'recording_info': {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
                 'device_type': device_type,
                 'resource_type': resource_type,
-                'device_count': len(devices),
+                'device_count': total,
                 'generator_version': '1.0.0',
                 'schema_version': '2023.2'
             },
             'statistics': {
-                'total_devices': len(devices),
-                'healthy_devices': sum(1 for d in devices if d.get('Status', {}).get('Health') == 'OK'),
-                'enabled_devices': sum(1 for d in devices if d.get('Status', {}).get('State') == 'Enabled')
+                'total_devices': total,
+                'healthy_devices': healthy,
+                'enabled_devices': enabled
             }
         }
 
@@ -85,12 +133,16 @@ class RecordingGenerator:
         }
 
     def _show_tree(self, base: Path):
+        # Purely cosmetic; skip the walk when output is piped or captured
+        if not self.console.is_terminal: return
         tree = Tree(f'[bold cyan]{base.name}[/bold cyan]')
-        def walk(node, p: Path, depth=0):
+        def walk(node, p: str, depth=0):
             if depth > 5: return
-            for item in sorted(p.iterdir()):
-                if item.is_dir():
-                    b = node.add(f'[blue]{item.name}/[/blue]'); walk(b, item, depth+1)
+            with os.scandir(p) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    b = node.add(f'[blue]{entry.name}/[/blue]'); walk(b, entry.path, depth+1)
                 else:
-                    node.add(f'[green]{item.name}[/green]')
-        walk(tree, base); self.console.print(tree)
+                    node.add(f'[green]{entry.name}[/green]')
+        walk(tree, str(base)); self.console.print(tree)
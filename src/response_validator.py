@@ -1,30 +1,207 @@
-import json
-from typing import Dict, List, Tuple
-from jsonschema import validate, ValidationError
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from pathlib import Path
+from types import MappingProxyType
+from .serialization import read_json
+
+try:
+    import jsonschema_rs
+except ImportError:  # optional Rust validator; jsonschema alone gives the same results
+    jsonschema_rs = None
+
+def _file_key(path: Path) -> Optional[Tuple[str, int]]:
+    """(path, mtime) cache key for a file, or None if it doesn't exist"""
+    try:
+        return str(path), path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+@lru_cache(maxsize=None)
+def _load_json(path: str, mtime_ns: int) -> Dict:
+    """Parse a JSON file once per process for as long as its mtime is unchanged"""
+    return read_json(path)
+
+def _compile_schema(schema: Dict):
+    """Build a validator for the schema's declared draft (latest draft if none)"""
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+def _compile_fast_validator(schema: Dict):
+    """jsonschema-rs validator for a fast is_valid() check, or None if unavailable for this schema"""
+    if jsonschema_rs is None:
+        return None
+    try:
+        return jsonschema_rs.validator_for(schema)
+    except Exception:
+        return None  # keywords jsonschema-rs can't compile fall back to jsonschema only
+
+@lru_cache(maxsize=None)
+def _compile_validators(path: str, mtime_ns: int) -> Tuple[Dict, Dict]:
+    """Compiled (jsonschema, jsonschema-rs) validators for every schema in a file, shared across instances"""
+    schemas = _load_json(path, mtime_ns)
+    validators = {resource_type: _compile_schema(schema) for resource_type, schema in schemas.items()}
+    fast = {resource_type: _compile_fast_validator(schema) for resource_type, schema in schemas.items()}
+    return validators, {resource_type: v for resource_type, v in fast.items() if v is not None}
+
+# Accepted Python types for the JSON type names used in validation_rules field_types.
+# Lenient on purpose: floats pass as integers (common LLM behavior) and tuples as arrays.
+ACCEPTED_TYPES = {'string': str, 'integer': (int, float), 'object': dict, 'boolean': bool, 'array': (list, tuple)}
+
+_MISSING = object()
+
+# Weight of each validation detail score in the overall compliance score
+SCORE_WEIGHTS = MappingProxyType({
+    'required_fields_score': 0.4,
+    'data_types_score': 0.25,
+    'value_constraints_score': 0.2,
+    'business_logic_score': 0.1,
+    'presentation_quality_score': 0.05
+})
+
+_SCORE_WEIGHT_ITEMS = tuple(SCORE_WEIGHTS.items())
+
+# Quality distribution bands: a score >= QUALITY_BAND_EDGES[i - 1] and below the next edge falls in QUALITY_BANDS[i]
+QUALITY_BAND_EDGES = (50, 60, 70, 80, 90)
+QUALITY_BANDS = ('poor', 'needs_improvement', 'acceptable', 'good', 'very_good', 'excellent')
+
+# validation_details of a device that passed every rule-based check
+PERFECT_DETAILS = dict.fromkeys(SCORE_WEIGHTS, 100)
+
+# Requirement opcodes for compiled business rules
+OP_PRESENT, OP_EQ, OP_IN, OP_GE = range(4)
+
+# Cross-field rule conditions from validation_rules, as (field, value) equality tests on the device
+CROSS_FIELD_CONDITIONS = {
+    'if_MediaType_is_HDD': ('MediaType', 'HDD'),
+    'if_MediaType_is_SSD': ('MediaType', 'SSD'),
+    'if_RAIDType_is_RAID0': ('RAIDType', 'RAID0'),
+    'if_RAIDType_is_RAID1': ('RAIDType', 'RAID1')
+}
+
+# Business requirements from validation_rules, as (opcode, constant); unknown requirements pass
+BUSINESS_REQUIREMENTS = {
+    'required': (OP_PRESENT, None),
+    'must_be_512_or_4096': (OP_IN, (512, 4096)),
+    'must_be_4096_or_higher': (OP_GE, 4096),
+    'must_be_0': (OP_EQ, 0),
+    'must_be_NonRedundant': (OP_EQ, 'NonRedundant'),
+    'must_be_Mirrored': (OP_EQ, 'Mirrored')
+}
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _enum_set(values):
+    """Allowed values as a frozenset of interned strings for O(1) membership; left as-is if not hashable"""
+    try:
+        return frozenset(map(_intern, values))
+    except TypeError:
+        return values
+
+def _is_allowed(value, allowed) -> bool:
+    try:
+        return value in allowed
+    except TypeError:
+        return False  # unhashable values (objects/arrays) never equal an enum member
+
+def _cross_field_condition(condition: str) -> Optional[Tuple[str, object]]:
+    """(field, value) test for a condition name; names embedding a known condition match it, as before"""
+    if condition in CROSS_FIELD_CONDITIONS:
+        return CROSS_FIELD_CONDITIONS[condition]
+    return next((test for name, test in CROSS_FIELD_CONDITIONS.items() if name in condition), None)
+
+def _requirement_met(data: Dict, field: str, op: int, const) -> bool:
+    if op == OP_EQ:
+        return data.get(field) == const
+    if op == OP_IN:
+        return data.get(field) in const
+    if op == OP_GE:
+        return data.get(field, 0) >= const
+    return field in data
+
+class RulePlan(NamedTuple):
+    """Rule checks specialised for one resource type"""
+    all_required: Tuple[str, ...]
+    type_required: Tuple[str, ...]
+    required_set: FrozenSet[str]
+    # ((cond field, cond value, ((field, requirement, op, const), ...)), ...)
+    cross_rules: Tuple[Tuple, ...]
 
 class ResponseValidator:
     def __init__(self, config):
         self.config = config
-        self.schemas = self._load_schemas()
-        self.schemas.update(self._load_swordfish())
+        self.schemas: Dict[str, Dict] = {}
+        # Compiled once per schema file and process; validate() only runs the compiled validators
+        self.validators: Dict[str, object] = {}
+        self.fast_validators: Dict[str, object] = {}
+        # Swordfish definitions are applied last and extend/override the Redfish ones
+        for key in (self._load_schemas(), self._load_swordfish()):
+            if key is not None:
+                validators, fast = _compile_validators(*key)
+                self.schemas.update(_load_json(*key))
+                self.validators.update(validators)
+                self.fast_validators.update(fast)
         self.rules = self._load_rules()
+        self._compile_rules()
+        self._presentation_ready_threshold = self.config.QUALITY_THRESHOLDS.get('presentation_ready', 75)
 
-    def _load_schemas(self) -> Dict:
-        p = Path(self.config.SPECS_DIR) / 'redfish_schemas.json'
-        return json.loads(p.read_text()) if p.exists() else {}
+    def _load_schemas(self) -> Optional[Tuple[str, int]]:
+        """Cache key of the Redfish schema bundle, if present"""
+        return _file_key(Path(self.config.SPECS_DIR) / 'redfish_schemas.json')
 
     def _load_rules(self) -> Dict:
         """Load enhanced validation rules from templates"""
-        rules_path = Path(self.config.TEMPLATE_FILES.get('validation_rules', 'templates/validation_rules.json'))
-        if rules_path.exists():
+        key = _file_key(self.config.TEMPLATE_FILES['validation_rules'])
+        if key is not None:
             try:
-                return json.loads(rules_path.read_text())
+                return _load_json(*key)
             except Exception as e:
                 print(f"Warning: Could not load validation rules: {e}")
                 return self._get_default_rules()
         return self._get_default_rules()
     
+    def _compile_rules(self):
+        """Resolve the rule lookups validate() needs once, since rules don't change per call"""
+        req = self.rules.get('required_fields', {})
+        all_required = tuple(map(_intern, req.get('all', [])))
+        # (field, accepted python types, rule type name) per typed field
+        self._field_types = tuple(
+            (field, ACCEPTED_TYPES.get(expected_type, object), expected_type)
+            for field, expected_type in self.rules.get('field_types', {}).items()
+        )
+        vc = self.rules.get('value_constraints', {})
+        self._status_constraints = tuple((sub, _enum_set(vc[sub])) for sub in ('State', 'Health') if sub in vc)
+        self._field_constraints = tuple((field, _enum_set(vc[field])) for field in ('Protocol', 'MediaType') if field in vc)
+        cross_validation = self.rules.get('advanced_validation', {}).get('cross_field_validation', {})
+        self._highlight_fields = tuple(self.rules.get('presentation_enhancements', {}).get('highlight_fields', []))
+        
+        # Per-type plans so validate() resolves everything type-specific with a single lookup
+        self._default_plan = RulePlan(all_required, (), frozenset(all_required), ())
+        self._plans = {
+            resource_type: self._compile_plan(all_required, req.get(resource_type, ()), cross_validation.get(resource_type, {}))
+            for resource_type in {**req, **cross_validation}
+        }
+    
+    def _compile_plan(self, all_required: Tuple[str, ...], type_fields: List[str], conditions: Dict) -> 'RulePlan':
+        """Build the RulePlan for one resource type"""
+        type_required = tuple(map(_intern, type_fields))
+        # Conditions that can never match and requirements that always pass are dropped here
+        cross_rules = []
+        for condition, requirements in conditions.items():
+            test = _cross_field_condition(condition)
+            if test is None:
+                continue
+            checks = tuple((sys.intern(field), requirement) + BUSINESS_REQUIREMENTS[requirement]
+                           for field, requirement in requirements.items() if requirement in BUSINESS_REQUIREMENTS)
+            cross_rules.append(test + (checks,))
+        return RulePlan(all_required, type_required, frozenset(all_required + type_required), tuple(cross_rules))
+    
     def _get_default_rules(self) -> Dict:
         """Default validation rules if template loading fails"""
         return {
@@ -38,146 +215,111 @@ class ResponseValidator:
         errs: List[str] = []
         warnings: List[str] = []
         compliance_score = 0
-        validation_details = {
-            'required_fields_score': 0,
-            'data_types_score': 0,
-            'value_constraints_score': 0,
-            'business_logic_score': 0,
-            'presentation_quality_score': 0
-        }
+        validation_details = dict.fromkeys(SCORE_WEIGHTS, 0)
         
         # Required fields validation
-        req = self.rules.get('required_fields', {})
-        all_fields = req.get('all', [])
-        type_fields = req.get(resource_type, [])
+        plan = self._plans.get(resource_type, self._default_plan)
+        all_fields = plan.all_required
+        type_fields = plan.type_required
         total_required = len(all_fields) + len(type_fields)
         missing_fields = 0
         
-        for f in all_fields:
-            if f not in data:
-                errs.append(f'Missing required field: {f}')
-                missing_fields += 1
-        
-        for f in type_fields:
-            if f not in data:
-                errs.append(f'Missing required field for {resource_type}: {f}')
-                missing_fields += 1
+        # One C-level subset test covers the common complete case; per-field errors only when something is missing
+        present = data.keys()
+        if not plan.required_set <= present:
+            missing_all = [f for f in all_fields if f not in present]
+            missing_type = [f for f in type_fields if f not in present]
+            errs.extend(f'Missing required field: {f}' for f in missing_all)
+            errs.extend(f'Missing required field for {resource_type}: {f}' for f in missing_type)
+            missing_fields = len(missing_all) + len(missing_type)
         
         if total_required > 0:
-            validation_details['required_fields_score'] = max(0, 100 - (missing_fields / total_required) * 100)
+            validation_details['required_fields_score'] = max(0, 100 - (missing_fields / total_required) * 100) if missing_fields else 100.0
         
         # Data type validation - more lenient approach
-        types = self.rules.get('field_types', {})
-        typemap = {'string': str, 'integer': int, 'object': dict, 'boolean': bool, 'array': list}
         type_errors = 0
         total_typed_fields = 0
         
-        for field, expected_type in types.items():
-            if field in data:
+        for field, accepted_types, expected_type in self._field_types:
+            value = data.get(field, _MISSING)
+            if value is not _MISSING:
                 total_typed_fields += 1
-                actual_type = type(data[field])
-                expected_python_type = typemap.get(expected_type, object)
-                
-                # More flexible type checking
-                if not isinstance(data[field], expected_python_type):
-                    # Check for common type mismatches that are acceptable
-                    if expected_type == 'integer' and isinstance(data[field], (int, float)):
-                        # Allow float for integer fields (common LLM behavior)
-                        continue
-                    elif expected_type == 'array' and isinstance(data[field], (list, tuple)):
-                        # Allow tuple for array fields
-                        continue
-                    elif expected_type == 'object' and isinstance(data[field], dict):
-                        # Allow dict for object fields
-                        continue
-                    else:
-                        # Add as warning instead of error for type mismatches
-                        warnings.append(f'Field {field} should be {expected_type}, got {actual_type.__name__}')
-                        type_errors += 1
+                if not isinstance(value, accepted_types):
+                    # Add as warning instead of error for type mismatches
+                    warnings.append(f'Field {field} should be {expected_type}, got {type(value).__name__}')
+                    type_errors += 1
         
         if total_typed_fields > 0:
-            validation_details['data_types_score'] = max(0, 100 - (type_errors / total_typed_fields) * 100)
+            validation_details['data_types_score'] = max(0, 100 - (type_errors / total_typed_fields) * 100) if type_errors else 100.0
         
         # Value constraints validation
-        vc = self.rules.get('value_constraints', {})
         constraint_errors = 0
         total_constraints = 0
         
         # Status validation
-        if 'Status' in data and isinstance(data['Status'], dict):
-            for sub in ('State', 'Health'):
-                if sub in vc and sub in data['Status']:
+        status = data.get('Status')
+        if isinstance(status, dict):
+            for sub, allowed in self._status_constraints:
+                if sub in status:
                     total_constraints += 1
-                    if data['Status'][sub] not in vc[sub]:
-                        errs.append(f'Invalid Status.{sub}: {data["Status"][sub]}')
+                    if not _is_allowed(status[sub], allowed):
+                        errs.append(f'Invalid Status.{sub}: {status[sub]}')
                         constraint_errors += 1
         
-        # Protocol validation
-        if 'Protocol' in data and 'Protocol' in vc:
-            total_constraints += 1
-            if data['Protocol'] not in vc['Protocol']:
-                errs.append(f'Invalid Protocol: {data["Protocol"]}')
-                constraint_errors += 1
-        
-        # Media type validation
-        if 'MediaType' in data and 'MediaType' in vc:
-            total_constraints += 1
-            if data['MediaType'] not in vc['MediaType']:
-                errs.append(f'Invalid MediaType: {data["MediaType"]}')
-                constraint_errors += 1
+        # Protocol and media type validation
+        for field, allowed in self._field_constraints:
+            if field in data:
+                total_constraints += 1
+                if not _is_allowed(data[field], allowed):
+                    errs.append(f'Invalid {field}: {data[field]}')
+                    constraint_errors += 1
         
         if total_constraints > 0:
-            validation_details['value_constraints_score'] = max(0, 100 - (constraint_errors / total_constraints) * 100)
+            validation_details['value_constraints_score'] = max(0, 100 - (constraint_errors / total_constraints) * 100) if constraint_errors else 100.0
         
         # Business logic validation
         business_logic_score = 100
-        advanced_validation = self.rules.get('advanced_validation', {})
         
         # Cross-field validation
-        cross_validation = advanced_validation.get('cross_field_validation', {})
-        if resource_type in cross_validation:
-            for condition, requirements in cross_validation[resource_type].items():
-                if self._evaluate_cross_field_condition(data, condition):
-                    for field, requirement in requirements.items():
-                        if not self._validate_business_requirement(data, field, requirement):
-                            warnings.append(f'Business logic warning: {field} {requirement}')
-                            business_logic_score -= 10
+        for cond_field, cond_value, requirements in plan.cross_rules:
+            if data.get(cond_field) == cond_value:
+                for field, requirement, op, const in requirements:
+                    if not _requirement_met(data, field, op, const):
+                        warnings.append(f'Business logic warning: {field} {requirement}')
+                        business_logic_score -= 10
         
         validation_details['business_logic_score'] = max(0, business_logic_score)
         
         # Presentation quality assessment
         presentation_score = 100
-        highlight_fields = self.rules.get('presentation_enhancements', {}).get('highlight_fields', [])
-        
-        for field in highlight_fields:
+        for field in self._highlight_fields:
             if field not in data:
                 presentation_score -= 5
                 warnings.append(f'Presentation enhancement: Consider adding {field}')
         
         validation_details['presentation_quality_score'] = max(0, presentation_score)
         
-        # Calculate overall compliance score
-        weights = {
-            'required_fields_score': 0.4,
-            'data_types_score': 0.25,
-            'value_constraints_score': 0.2,
-            'business_logic_score': 0.1,
-            'presentation_quality_score': 0.05
-        }
-        
-        for metric, weight in weights.items():
-            compliance_score += validation_details[metric] * weight
+        # Calculate overall compliance score; the weights sum to 1, so a device that aced every check scores 100
+        if validation_details == PERFECT_DETAILS:
+            compliance_score = 100.0
+        else:
+            for metric, weight in _SCORE_WEIGHT_ITEMS:
+                compliance_score += validation_details[metric] * weight
         
         # Schema validation - more lenient approach
-        if resource_type in self.schemas:
+        fast = self.fast_validators.get(resource_type)
+        if resource_type in self.validators and (fast is None or not fast.is_valid(data)):
             try:
-                validate(instance=data, schema=self.schemas[resource_type])
+                # same error selection as jsonschema.validate, without recompiling the schema per call
+                error = best_match(self.validators[resource_type].iter_errors(data))
+                if error is not None:
+                    raise error
             except ValidationError as e:
                 # Handle schema validation errors more gracefully
-                error_message = str(e.message)
+                error_message = e.message
                 
                 # Check if it's a type mismatch that we can handle
-                if "is not of type" in error_message:
+                if e.validator == 'type':
                     # This is a type mismatch - add as warning instead of error
                     warnings.append(f'Schema type warning: {error_message}')
                     compliance_score = max(0, compliance_score - 5)  # Smaller penalty for type issues
@@ -186,46 +328,19 @@ class ResponseValidator:
                     errs.append(f'Schema validation error: {error_message}')
                     compliance_score = max(0, compliance_score - 15)
         
+        valid = not errs
         validation_result = {
-            'valid': len(errs) == 0,
+            'valid': valid,
             'compliance_score': round(compliance_score, 2),
             'errors': errs,
             'warnings': warnings,
             'validation_details': validation_details,
             'resource_type': resource_type,
-            'presentation_ready': compliance_score >= self.config.QUALITY_THRESHOLDS.get('presentation_ready', 75)
+            'presentation_ready': compliance_score >= self._presentation_ready_threshold
         }
         
-        return (len(errs) == 0, errs, validation_result)
+        return (valid, errs, validation_result)
     
-    def _evaluate_cross_field_condition(self, data: Dict, condition: str) -> bool:
-        """Evaluate cross-field validation conditions"""
-        if 'if_MediaType_is_HDD' in condition:
-            return data.get('MediaType') == 'HDD'
-        elif 'if_MediaType_is_SSD' in condition:
-            return data.get('MediaType') == 'SSD'
-        elif 'if_RAIDType_is_RAID0' in condition:
-            return data.get('RAIDType') == 'RAID0'
-        elif 'if_RAIDType_is_RAID1' in condition:
-            return data.get('RAIDType') == 'RAID1'
-        return False
-    
-    def _validate_business_requirement(self, data: Dict, field: str, requirement: str) -> bool:
-        """Validate business logic requirements"""
-        if requirement == 'required':
-            return field in data
-        elif requirement == 'must_be_512_or_4096':
-            return data.get(field) in [512, 4096]
-        elif requirement == 'must_be_4096_or_higher':
-            return data.get(field, 0) >= 4096
-        elif requirement == 'must_be_0':
-            return data.get(field) == 0
-        elif requirement == 'must_be_NonRedundant':
-            return data.get(field) == 'NonRedundant'
-        elif requirement == 'must_be_Mirrored':
-            return data.get(field) == 'Mirrored'
-        return True
-
     def validate_batch(self, devices: List[Dict], resource_type: str) -> Dict:
         """Enhanced batch validation with comprehensive analysis"""
         out = {
@@ -247,53 +362,40 @@ class ResponseValidator:
             }
         }
         
-        total_score = 0
+        results = (self.validate(d, resource_type) for d in devices)
         
-        for i, d in enumerate(devices):
-            ok, e, validation_result = self.validate(d, resource_type)
+        batch_errors, batch_warnings, scores = out['errors'], out['warnings'], out['compliance_scores']
+        distribution = out['quality_distribution']
+        for i, (ok, e, validation_result) in enumerate(results):
             out['valid' if ok else 'invalid'] += 1
             
             if not ok:
-                out['errors'].append({'device_index': i, 'errors': e, 'validation_result': validation_result})
+                batch_errors.append({'device_index': i, 'errors': e, 'validation_result': validation_result})
             
-            if validation_result.get('warnings'):
-                out['warnings'].extend([{'device_index': i, 'warning': w} for w in validation_result.get('warnings', [])])
+            # validate() always returns a warnings list; stream it straight into the batch list
+            batch_warnings.extend({'device_index': i, 'warning': w} for w in validation_result['warnings'])
             
             compliance_score = validation_result.get('compliance_score', 0)
-            out['compliance_scores'].append(compliance_score)
-            total_score += compliance_score
+            scores.append(compliance_score)
             
             if validation_result.get('presentation_ready', False):
                 out['presentation_ready_count'] += 1
             
             # Quality distribution
-            score = compliance_score
-            if score >= 90:
-                out['quality_distribution']['excellent'] += 1
-            elif score >= 80:
-                out['quality_distribution']['very_good'] += 1
-            elif score >= 70:
-                out['quality_distribution']['good'] += 1
-            elif score >= 60:
-                out['quality_distribution']['acceptable'] += 1
-            elif score >= 50:
-                out['quality_distribution']['needs_improvement'] += 1
-            else:
-                out['quality_distribution']['poor'] += 1
+            distribution[QUALITY_BANDS[bisect_right(QUALITY_BAND_EDGES, compliance_score)]] += 1
         
         if out['total'] > 0:
-            out['average_score'] = round(total_score / out['total'], 2)
+            out['average_score'] = round(sum(scores) / out['total'], 2)
         
         return out
 
 
-    def _load_swordfish(self) -> Dict:
-        from pathlib import Path
-        import json
-        p = Path(self.config.SPECS_DIR) / 'swordfish_extensions.json'
-        if p.exists():
+    def _load_swordfish(self) -> Optional[Tuple[str, int]]:
+        """Cache key of the Swordfish extensions, if present and readable"""
+        key = _file_key(Path(self.config.SPECS_DIR) / 'swordfish_extensions.json')
+        if key is not None:
             try:
-                return json.loads(p.read_text())
+                _load_json(*key)
             except Exception:
-                return {}
-        return {}
+                return None
+        return key
@@ -0,0 +1,62 @@
+"""JSON serialization helpers, using orjson when it is installed"""
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is always available
+    orjson = None
+
+# Files at least this large are memory-mapped by read_json instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+
+
+def dumps_pretty(obj) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects non-str keys, >64-bit ints and dict-likes; let stdlib handle those
+            pass
+    return json.dumps(obj, indent=2, default=dict).encode('utf-8')
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj as compact UTF-8 JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(',', ':'), default=dict).encode('utf-8')
+
+
+def loads(data):
+    """Parse JSON from str or bytes"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def read_json(path: Union[str, Path]):
+    """Parse a JSON file; large files are parsed straight from a read-only memory map"""
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return loads(f.read())
+        # orjson reads the mapped pages directly, so the raw text is never copied onto the heap
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def write_json(path: Union[str, Path], obj):
+    """Write obj to path as indented JSON"""
+    # Raw fd I/O: no Path allocation or text-mode file object per write
+    data = memoryview(dumps_pretty(obj))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
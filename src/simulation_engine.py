@@ -1,96 +1,419 @@
+import asyncio
+import copy
+import hashlib
 import json
+import re
 import time
-from typing import Dict, Optional, List, Any
+from collections import OrderedDict
+from contextlib import aclosing
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional
+import openai
 from langchain_openai import AzureChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from rich.panel import Panel
+from . import serialization
 import random
 
+SYSTEM_PROMPT = "You are a Redfish/Swordfish compliance expert. Generate only valid JSON."
+# Shared by every request; message objects are not modified once built
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
+# Terminal states reported by the Batch API
+BATCH_TERMINAL_STATES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+# Devices generated per resource type in a demo scenario, unless overridden
+SCENARIO_DEVICE_COUNT = 2
+
+# Status each simulated operation leaves a device in; reset also stamps LastResetTime
+DEVICE_OPERATIONS = MappingProxyType({
+    'power_on': MappingProxyType({'State': 'Enabled', 'Health': 'OK'}),
+    'power_off': MappingProxyType({'State': 'Disabled', 'Health': 'OK'}),
+    'reset': MappingProxyType({'State': 'Enabled', 'Health': 'OK'}),
+    'maintenance': MappingProxyType({'State': 'StandbyOffline', 'Health': 'Warning'}),
+    'test': MappingProxyType({'State': 'InTest', 'Health': 'OK'})
+})
+
+# Upper bound, in seconds, on the backoff between generation retries (a Retry-After header wins)
+MAX_RETRY_DELAY = 8
+
+# Preferred mockup profiles per resource type, best first
+PROFILE_PRIORITIES = MappingProxyType({
+    'StorageController': ('public-localstorage', 'public-nvmeof-jbof'),
+    'Drive': ('public-localstorage', 'public-nvmeof-jbof'),
+    'Volume': ('public-localstorage',),
+    'ComputerSystem': ('public-rackmount1', 'public-bladed', 'public-tower'),
+    'Processor': ('public-rackmount1', 'public-bladed'),
+    'Memory': ('public-rackmount1', 'public-bladed'),
+    'NetworkAdapter': ('public-smartnic', 'public-sasfabric'),
+    'Chassis': ('public-rackmount1', 'public-tower', 'public-bladed'),
+    'Manager': ('public-rackmount1', 'public-bladed')
+})
+
+# Where the JSON value in a streamed reply starts, and the characters that can complete it
+JSON_START = re.compile(r'[{\[]')
+JSON_END = re.compile(r'[}\]]')
+JSON_DECODER = json.JSONDecoder()
+
+# Replies kept by the response cache (only used when TEMPERATURE is 0)
+LLM_CACHE_SIZE = 256
+
+
+def _retry_delay(err: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying after an API error, or None if retrying won't help"""
+    if isinstance(err, openai.APIStatusError):
+        if not isinstance(err, openai.RateLimitError) and err.status_code < 500:
+            return None
+        retry_after = err.response.headers.get('retry-after')
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            pass  # absent, or an HTTP date; use the backoff below
+    elif not isinstance(err, openai.APIConnectionError):
+        return None
+    # Jittered exponential backoff (1s, 2s, 4s... capped), so concurrent retries spread out
+    return min(2 ** attempt + random.random(), MAX_RETRY_DELAY)
+
+
+class LLMCache:
+    """In-memory LRU cache of model replies keyed by a hash of the request"""
+
+    def __init__(self, maxsize: int = LLM_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def key(system: str, prompt: str, model: str, temperature: float) -> str:
+        payload = json.dumps(
+            {"sys": system, "prompt": prompt, "model": model, "temp": temperature},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        content = self._entries.get(key)
+        if content is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return content
+
+    def set(self, key: str, content: str):
+        self._entries[key] = content
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
 class SimulationEngine:
-    def __init__(self, config, prompt_processor, validator):
+    def __init__(self, config, prompt_processor, validator, http_client=None, http_async_client=None,
+                 quiet: bool = False):
         self.config = config
         self.prompt_processor = prompt_processor
         self.validator = validator
         self.console = Console()
+        # quiet disables the live progress display (CI / batch runs)
+        self.quiet = quiet
+        # Optional shared httpx clients, so callers can pool connections across components
+        self.http_client = http_client
+        self.http_async_client = http_async_client
 
-        # Initialize LLM
+        # Initialize LLM; JSON mode makes every reply a bare JSON object, so no extraction is needed
         self.llm = AzureChatOpenAI(
             azure_deployment=config.AZURE_OPENAI_DEPLOYMENT_NAME,
             openai_api_version=config.AZURE_OPENAI_API_VERSION,
             azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
             openai_api_key=config.AZURE_OPENAI_API_KEY,
-            temperature=config.TEMPERATURE
-        )
+            temperature=config.TEMPERATURE,
+            http_client=http_client,
+            http_async_client=http_async_client
+        ).bind(response_format={"type": "json_object"})
+        # Identical requests only give identical replies when sampling is deterministic
+        self.llm_cache = LLMCache() if config.TEMPERATURE == 0 else None
+        # Fallback device templates by resource type, see _fallback_template
+        self._fallback_templates: Dict[str, Dict] = {}
 
-    def generate_device(self, device_type: str, resource_type: str, count: int = 1, 
-                       profile: str = None, context: Dict = None) -> List[Dict]:
-        """Generate multiple device instances with profile support"""
-        devices = []
-        
-        with Progress(
+    @cached_property
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        return asyncio.new_event_loop()
+
+    def _progress(self) -> Progress:
+        """Spinner progress display; throttled, cleared when done, and disabled when quiet"""
+        return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
+            console=self.console,
+            transient=True,
+            refresh_per_second=4,
+            disable=self.quiet
+        )
+
+    def run(self, coro):
+        """Run a coroutine on the engine's event loop.
+
+        The loop lives as long as the engine, so pooled async connections opened
+        by one call are still usable by the next (asyncio.run would close them).
+        """
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        """Close the engine's event loop"""
+        if '_loop' in self.__dict__:
+            self._loop.close()
+            del self.__dict__['_loop']
+
+    def generate_device(self, device_type: str, resource_type: str, count: int = 1, 
+                       profile: str = None, context: Dict = None, stream: bool = False) -> List[Dict]:
+        """Generate multiple device instances with profile support.
+
+        With stream=True the progress line shows how much output has arrived; use it
+        for interactive callers.
+        """
+        with self._progress() as progress:
+            description = f"[cyan]Generating {count} {device_type} device(s) using {profile or 'default'} profile..."
+            task = progress.add_task(description, total=count)
+            received = 0
+            
+            def on_chunk(text: str):
+                nonlocal received
+                received += len(text)
+                progress.update(task, description=f"{description} [dim]{received} chars received[/dim]")
+            
+            return self.run(self.agenerate_device(
+                device_type,
+                resource_type,
+                count=count,
+                profile=profile,
+                context=context,
+                on_complete=lambda: progress.update(task, advance=1),
+                on_chunk=on_chunk if stream else None
+            ))
+
+    async def agenerate_device(self, device_type: str, resource_type: str, count: int = 1,
+                               profile: str = None, context: Dict = None,
+                               on_complete: Optional[Callable[[], None]] = None,
+                               on_chunk: Optional[Callable[[str], None]] = None,
+                               semaphore: Optional[asyncio.Semaphore] = None) -> List[Dict]:
+        """Generate device instances concurrently, at most MAX_CONCURRENCY requests in flight.
+
+        If on_chunk is given, each streamed text chunk is passed to it.
+        Several devices are first requested in a single completion; only the instances
+        that come back missing or invalid get their own request. Pass a shared
+        semaphore to bound concurrency across several calls.
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.config.MAX_CONCURRENCY)
+        # One timestamp for every instance and retry of this call
+        context = self._timestamped(context)
+        generated: Dict[int, Dict] = {}
+        if count > 1:
+            async with semaphore:
+                generated = await self._agenerate_device_set(
+                    device_type, resource_type, count, profile=profile, context=context, on_chunk=on_chunk
+                )
+            if on_complete:
+                for _ in generated:
+                    on_complete()
+
+        async def generate(instance_id: int) -> Optional[Dict]:
+            if instance_id in generated:
+                return generated[instance_id]
+            async with semaphore:
+                device = await self._agenerate_single_device(
+                    device_type,
+                    resource_type,
+                    instance_id=instance_id,
+                    profile=profile,
+                    context=context,
+                    on_chunk=on_chunk
+                )
+            if on_complete:
+                on_complete()
+            return device
+
+        # gather keeps results in instance order; one failed instance doesn't discard the others
+        devices = await asyncio.gather(*(generate(i) for i in range(1, count + 1)), return_exceptions=True)
+        for error in devices:
+            if isinstance(error, Exception):
+                self.console.print(f"[red]✗[/red] Error generating {resource_type} device: {error}")
+        return [device for device in devices if device and not isinstance(device, BaseException)]
+
+    def generate_plan(self, devices_spec: List[Dict]) -> Dict[str, List[Dict]]:
+        """Generate every spec's devices concurrently and return them by spec key.
+
+        Specs use the same shape as submit_batch; one semaphore bounds the
+        in-flight requests across all of them.
+        """
+        total = sum(spec['count'] for spec in devices_spec)
+        with self._progress() as progress:
             task = progress.add_task(
-                f"[cyan]Generating {count} {device_type} device(s) using {profile or 'default'} profile...", 
-                total=count
+                f"[cyan]Generating {total} devices across {len(devices_spec)} resource types...", total=total
             )
             
-            for i in range(count):
-                device = self._generate_single_device(
-                    device_type, 
-                    resource_type, 
-                    instance_id=i+1,
-                    profile=profile,
-                    context=context
+            async def generate_all():
+                semaphore = asyncio.Semaphore(self.config.MAX_CONCURRENCY)
+                return await asyncio.gather(*(
+                    self.agenerate_device(
+                        spec['device_type'],
+                        spec['resource_type'],
+                        count=spec['count'],
+                        profile=spec['profile'],
+                        on_complete=lambda: progress.update(task, advance=1),
+                        semaphore=semaphore
+                    )
+                    for spec in devices_spec
+                ), return_exceptions=True)
+            
+            devices = self.run(generate_all())
+        
+        generated = {}
+        for spec, spec_devices in zip(devices_spec, devices):
+            if isinstance(spec_devices, BaseException):
+                # keep the other resource types' devices when one type fails outright
+                self.console.print(f"[red]✗[/red] Error generating {spec['resource_type']} devices: {spec_devices}")
+                spec_devices = []
+            generated[spec['key']] = spec_devices
+        return generated
+
+    async def _agenerate_device_set(self, device_type: str, resource_type: str, count: int,
+                                    profile: str = None, context: Dict = None,
+                                    on_chunk: Optional[Callable[[str], None]] = None) -> Dict[int, Dict]:
+        """Request count devices in one JSON-mode completion and return the valid ones by instance id"""
+        prompt = self.prompt_processor.create_batch_device_prompt(
+            device_type=device_type,
+            resource_type=resource_type,
+            count=count,
+            context=self._device_context(profile, context),
+            profile=profile
+        )
+        messages = [
+            SYSTEM_MESSAGE,
+            HumanMessage(content=prompt)
+        ]
+        
+        try:
+            content = await self._acomplete(messages, on_chunk)
+            devices = serialization.loads(content)['devices']
+        except Exception as err:
+            self.console.print(f"[yellow]⚠[/yellow] Multi-device request failed ({err.__class__.__name__}), generating {resource_type} instances individually")
+            return {}
+        
+        candidates = {
+            instance_id: self._apply_required_defaults(device_data, resource_type)
+            for instance_id, device_data in enumerate(devices[:count], 1)
+            if isinstance(device_data, dict)
+        }
+        # One batch validation for the whole reply; only the failures are regenerated individually
+        report = self.validator.validate_batch(list(candidates.values()), resource_type)
+        invalid = {error['device_index'] for error in report['errors']}
+        generated = {}
+        for index, (instance_id, device_data) in enumerate(candidates.items()):
+            if index not in invalid:
+                self.console.print(
+                    f"[green]✓[/green] Generated valid {resource_type} instance {instance_id} using {profile or 'default'} profile"
                 )
-                if device:
-                    devices.append(device)
-                progress.update(task, advance=1)
+                generated[instance_id] = device_data
+        return generated
+
+    async def _acomplete(self, messages: List, on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        """Stream the model's reply, passing chunks to on_chunk when given.
+
+        The stream is closed as soon as the reply holds a complete JSON value and only
+        that value is returned, so trailing output (JSON mode can pad with whitespace)
+        is not waited on.
+        """
+        key = None
+        if self.llm_cache is not None:
+            key = LLMCache.key(messages[0].content, messages[-1].content,
+                               self.config.AZURE_OPENAI_DEPLOYMENT_NAME, self.config.TEMPERATURE)
+            content = self.llm_cache.get(key)
+            if content is not None:
+                if on_chunk:
+                    on_chunk(content)
+                return content
+        
+        content = ''
+        start = None
+        async with aclosing(self.llm.astream(messages)) as stream:
+            async for chunk in stream:
+                if not chunk.content:
+                    continue
+                content += chunk.content
+                if on_chunk:
+                    on_chunk(chunk.content)
+                if start is None:
+                    match = JSON_START.search(content)
+                    start = match.start() if match else None
+                # The value opened at start can only have just completed if this chunk closed a bracket
+                if start is not None and JSON_END.search(chunk.content):
+                    try:
+                        _, end = JSON_DECODER.raw_decode(content, start)
+                    except ValueError:
+                        continue
+                    content = content[start:end]
+                    break
         
-        return devices
+        if key is not None:
+            self.llm_cache.set(key, content)
+        return content
+
+    def _timestamped(self, context: Dict = None) -> Optional[Dict]:
+        """Add a generation_timestamp shared by every prompt built from the returned context"""
+        # A timestamp would make prompts differ between runs and defeat the response cache
+        if self.llm_cache is not None:
+            return context
+        return {'generation_timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ'), **(context or {})}
 
-    def _generate_single_device(self, device_type: str, resource_type: str,
-                               instance_id: int = 1, profile: str = None, 
-                               context: Dict = None) -> Optional[Dict]:
+    def _device_context(self, profile: str = None, context: Dict = None, **extra) -> Dict:
+        """Build the prompt context for a generation request"""
+        enhanced_context = {**extra, 'profile': profile}
+        if context:
+            enhanced_context.update(context)
+        return enhanced_context
+
+    def _device_prompt(self, device_type: str, resource_type: str, instance_id: int,
+                       profile: str = None, context: Dict = None) -> str:
+        """Build the generation prompt for one device instance"""
+        # Create prompt with profile support
+        return self.prompt_processor.create_device_prompt(
+            device_type=device_type,
+            resource_type=resource_type,
+            context=self._device_context(profile, context, instance_id=instance_id),
+            profile=profile
+        )
+
+    async def _agenerate_single_device(self, device_type: str, resource_type: str,
+                                       instance_id: int = 1, profile: str = None, 
+                                       context: Dict = None,
+                                       on_chunk: Optional[Callable[[str], None]] = None) -> Optional[Dict]:
         """Generate a single device instance with retry logic and profile support"""
         retries = 0
+        # The prompt doesn't change between retries; build it once
+        prompt = self._device_prompt(device_type, resource_type, instance_id, profile, context)
+        messages = [
+            SYSTEM_MESSAGE,
+            HumanMessage(content=prompt)
+        ]
         
         while retries < self.config.MAX_RETRIES:
             try:
-                # Create enhanced context
-                enhanced_context = {
-                    'instance_id': instance_id,
-                    'profile': profile,
-                    'generation_timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ')
-                }
-                if context:
-                    enhanced_context.update(context)
-                
-                # Create prompt with profile support
-                prompt = self.prompt_processor.create_device_prompt(
-                    device_type=device_type,
-                    resource_type=resource_type,
-                    context=enhanced_context,
-                    profile=profile
-                )
-                
-                # Generate response
-                messages = [
-                    SystemMessage(content="You are a Redfish/Swordfish compliance expert. Generate only valid JSON."),
-                    HumanMessage(content=prompt)
-                ]
-                
                 try:
-                    response = self.llm.invoke(messages)
-                    json_str = self._extract_json(response.content)
-                    device_data = json.loads(json_str)
+                    device_data = serialization.loads(await self._acomplete(messages, on_chunk))
                 except Exception as llm_err:
-                    # Network/API errors: fall back to spec-based example to keep demo running
+                    # Rate limits, 5xx and connection errors are retried after a pause while attempts remain
+                    delay = _retry_delay(llm_err, retries)
+                    if delay is not None and retries + 1 < self.config.MAX_RETRIES:
+                        self.console.print(f"[yellow]⚠[/yellow] {llm_err.__class__.__name__} from Azure OpenAI, retrying {resource_type} instance {instance_id} in {delay:.1f}s")
+                        retries += 1
+                        await asyncio.sleep(delay)
+                        continue
+                    # Otherwise fall back to spec-based example to keep demo running
                     self.console.print(f"[yellow]⚠[/yellow] LLM unavailable ({llm_err.__class__.__name__}). Falling back to spec example for {resource_type}.")
                     device_data = self._fallback_from_example(resource_type, instance_id)
                 
@@ -109,21 +432,30 @@ class SimulationEngine:
                         f"[yellow]⚠[/yellow] Validation failed, retrying... Errors: {errors[:2]}"  # Show first 2 errors
                     )
                     retries += 1
+                    # Tell the model what to fix rather than resending (or re-hitting the cache with) the same prompt
+                    messages[-1] = HumanMessage(
+                        content=f"{prompt}\n\nA previous attempt failed validation with these errors; fix them: {errors[:5]}"
+                    )
                     
             except Exception as e:
+                # Local failures (defaults, validation) don't get better with waiting
                 self.console.print(f"[red]✗[/red] Error generating device: {str(e)}")
                 retries += 1
-                time.sleep(1)  # Brief delay before retry
         
         self.console.print(f"[red]✗[/red] Failed to generate valid device after {self.config.MAX_RETRIES} retries")
         return None
 
-    def run_demo_scenario(self, scenario_key: str) -> Dict[str, Any]:
-        """Run a complete demo scenario"""
-        if scenario_key not in self.config.DEMO_SCENARIOS:
+    def run_demo_scenario(self, scenario_key: str, use_batch: bool = False,
+                          counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Run a complete demo scenario, optionally through the Batch API.
+
+        counts overrides the number of devices per resource type; otherwise the
+        scenario's device_counts, then SCENARIO_DEVICE_COUNT, apply.
+        """
+        scenario = self.config.get_demo_scenario(scenario_key)
+        if scenario is None:
             raise ValueError(f"Unknown scenario: {scenario_key}")
         
-        scenario = self.config.DEMO_SCENARIOS[scenario_key]
         self.console.print(Panel(f"[bold cyan]{scenario['name']}[/bold cyan]\n{scenario['description']}", 
                                 title="Demo Scenario", border_style="cyan"))
         
@@ -132,25 +464,34 @@ class SimulationEngine:
             'devices': {},
             'total_generated': 0,
             'total_valid': 0,
+            'success_rate': 0.0,
+            'all_devices': [],
+            'device_types': [],
             'profiles_used': scenario['profiles']
         }
         
-        # Generate devices for each resource type
-        for resource_type in scenario['devices']:
-            self.console.print(f"\n[bold]Generating {resource_type} devices...[/bold]")
-            
-            # Select appropriate profile
-            profile = self._select_profile_for_resource(resource_type, scenario['profiles'])
-            
-            # Generate 2-3 devices of this type
-            count = random.randint(2, 3)
-            devices = self.generate_device(
-                device_type=resource_type.lower().replace('_', ' '),
-                resource_type=resource_type,
-                count=count,
-                profile=profile
-            )
-            
+        # Select a profile and a fixed count for each resource type up front,
+        # so all types can be generated together (or in one batch submission)
+        counts = {**scenario.get('device_counts', {}), **(counts or {})}
+        plan = [
+            {
+                'key': resource_type,
+                'device_type': resource_type.lower().replace('_', ' '),
+                'resource_type': resource_type,
+                'count': counts.get(resource_type, SCENARIO_DEVICE_COUNT),
+                'profile': self._select_profile_for_resource(resource_type, scenario['profiles'])
+            }
+            for resource_type in scenario['devices']
+        ]
+        self.console.print(f"\n[bold]Generating {', '.join(spec['key'] for spec in plan)} devices...[/bold]")
+        if use_batch:
+            generated = self.wait_for_batch(self.submit_batch(plan), plan)
+        else:
+            generated = self.generate_plan(plan)
+        
+        for spec in plan:
+            resource_type, profile = spec['resource_type'], spec['profile']
+            devices = generated[spec['key']]
             if devices:
                 results['devices'][resource_type] = {
                     'count': len(devices),
@@ -158,6 +499,8 @@ class SimulationEngine:
                     'devices': devices
                 }
                 results['total_generated'] += len(devices)
+                results['all_devices'].extend(devices)
+                results['device_types'].append(resource_type)
                 
                 # Validate all devices
                 validation_result = self.validator.validate_batch(devices, resource_type)
@@ -166,35 +509,24 @@ class SimulationEngine:
                 self.console.print(f"[green]✓[/green] Generated {len(devices)} {resource_type} devices using {profile} profile")
                 self.console.print(f"  Validation: {validation_result['valid']}/{len(devices)} valid")
         
+        if results['total_generated']:
+            results['success_rate'] = results['total_valid'] * 100.0 / results['total_generated']
+        if self.llm_cache is not None:
+            self.console.print(f"  LLM cache: {self.llm_cache.hits} hits, {self.llm_cache.misses} misses")
         return results
 
     def _select_profile_for_resource(self, resource_type: str, available_profiles: List[str]) -> str:
         """Select the most appropriate profile for a resource type"""
-        # Priority mapping for resource types
-        profile_priorities = {
-            'StorageController': ['public-localstorage', 'public-nvmeof-jbof'],
-            'Drive': ['public-localstorage', 'public-nvmeof-jbof'],
-            'Volume': ['public-localstorage'],
-            'ComputerSystem': ['public-rackmount1', 'public-bladed', 'public-tower'],
-            'Processor': ['public-rackmount1', 'public-bladed'],
-            'Memory': ['public-rackmount1', 'public-bladed'],
-            'NetworkAdapter': ['public-smartnic', 'public-sasfabric'],
-            'Chassis': ['public-rackmount1', 'public-tower', 'public-bladed'],
-            'Manager': ['public-rackmount1', 'public-bladed']
-        }
-        
-        # Get priority list for this resource type
-        priorities = profile_priorities.get(resource_type, available_profiles)
-        
-        # Find the first available profile from priorities
-        for profile in priorities:
-            if profile in available_profiles:
-                return profile
+        # Find the first available profile from the resource type's priorities
+        available = frozenset(available_profiles)
+        profile = next((p for p in PROFILE_PRIORITIES.get(resource_type, ()) if p in available), None)
         
         # Fallback to first available profile
-        return available_profiles[0] if available_profiles else None
+        if profile is None and available_profiles:
+            profile = available_profiles[0]
+        return profile
 
-    def generate_comprehensive_infrastructure(self, profile: str = None) -> Dict[str, Any]:
+    def generate_comprehensive_infrastructure(self, profile: str = None, use_batch: bool = False) -> Dict[str, Any]:
         """Generate a comprehensive infrastructure with multiple device types"""
         self.console.print(Panel("[bold cyan]Comprehensive Infrastructure Generation[/bold cyan]\n"
                                 "Generating complete data center infrastructure...", 
@@ -213,18 +545,31 @@ class SimulationEngine:
             'infrastructure': {},
             'total_devices': 0,
             'total_valid': 0,
+            'success_rate': 0.0,
+            'all_devices': [],
+            'device_types': [],
             'profile_used': profile
         }
         
+        # All components are generated together (or in one batch submission)
+        plan = [
+            {
+                'key': component,
+                'device_type': config['type'].lower().replace('_', ' '),
+                'resource_type': config['type'],
+                'count': config['count'],
+                'profile': profile
+            }
+            for component, config in infrastructure.items()
+        ]
+        self.console.print(f"\n[bold]Generating {', '.join(spec['resource_type'] for spec in plan)} devices...[/bold]")
+        if use_batch:
+            generated = self.wait_for_batch(self.submit_batch(plan), plan)
+        else:
+            generated = self.generate_plan(plan)
+        
         for component, config in infrastructure.items():
-            self.console.print(f"\n[bold]Generating {config['count']} {config['type']} devices...[/bold]")
-            
-            devices = self.generate_device(
-                device_type=config['type'].lower().replace('_', ' '),
-                resource_type=config['type'],
-                count=config['count'],
-                profile=profile
-            )
+            devices = generated[component]
             
             if devices:
                 results['infrastructure'][component] = {
@@ -233,6 +578,8 @@ class SimulationEngine:
                     'devices': devices
                 }
                 results['total_devices'] += len(devices)
+                results['all_devices'].extend(devices)
+                results['device_types'].append(config['type'])
                 
                 # Validate
                 validation_result = self.validator.validate_batch(devices, config['type'])
@@ -240,29 +587,113 @@ class SimulationEngine:
                 
                 self.console.print(f"[green]✓[/green] {len(devices)} {config['type']} devices generated")
         
+        if results['total_devices']:
+            results['success_rate'] = results['total_valid'] * 100.0 / results['total_devices']
         return results
 
-    def _extract_json(self, content: str) -> str:
-        """Extract JSON from LLM response"""
-        # Try to find JSON in the response
-        start_markers = ['{', '[']
-        end_markers = ['}', ']']
+    @cached_property
+    def batch_client(self):
+        """OpenAI SDK client for the Batch API, created on first use"""
+        from openai import AzureOpenAI
+        return AzureOpenAI(
+            api_key=self.config.AZURE_OPENAI_API_KEY,
+            api_version=self.config.AZURE_OPENAI_API_VERSION,
+            azure_endpoint=self.config.AZURE_OPENAI_ENDPOINT,
+            http_client=self.http_client
+        )
+
+    def submit_batch(self, devices_spec: List[Dict]) -> str:
+        """Upload one chat request per device as JSONL and start a batch job.
+
+        Each spec needs key, device_type, resource_type, count and profile;
+        requests are tagged '<key>-<instance_id>' so results can be mapped back.
+        """
+        if not self.config.AZURE_OPENAI_BATCH_DEPLOYMENT_NAME:
+            raise ValueError("AZURE_OPENAI_BATCH_DEPLOYMENT_NAME is not configured")
+        
+        lines = []
+        context = self._timestamped()
+        for spec in devices_spec:
+            for instance_id in range(1, spec['count'] + 1):
+                prompt = self._device_prompt(spec['device_type'], spec['resource_type'], instance_id,
+                                             spec['profile'], context)
+                lines.append(serialization.dumps({
+                    'custom_id': f"{spec['key']}-{instance_id}",
+                    'method': 'POST',
+                    'url': '/chat/completions',
+                    'body': {
+                        'model': self.config.AZURE_OPENAI_BATCH_DEPLOYMENT_NAME,
+                        'messages': [
+                            {'role': 'system', 'content': SYSTEM_PROMPT},
+                            {'role': 'user', 'content': prompt}
+                        ],
+                        'temperature': self.config.TEMPERATURE,
+                        'response_format': {'type': 'json_object'}
+                    }
+                }))
         
-        for start_marker in start_markers:
-            if start_marker in content:
-                start_idx = content.index(start_marker)
-                # Find matching end marker
-                bracket_count = 0
-                for i, char in enumerate(content[start_idx:], start_idx):
-                    if char in start_markers:
-                        bracket_count += 1
-                    elif char in end_markers:
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            return content[start_idx:i+1]
+        batch_file = self.batch_client.files.create(
+            file=('devices.jsonl', b'\n'.join(lines)),
+            purpose='batch'
+        )
+        batch = self.batch_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint='/chat/completions',
+            completion_window='24h'
+        )
+        self.console.print(f"[cyan]Submitted batch {batch.id} with {len(lines)} device requests[/cyan]")
+        return batch.id
+
+    def wait_for_batch(self, batch_id: str, devices_spec: List[Dict],
+                       poll_interval: float = 30.0) -> Dict[str, List[Dict]]:
+        """Poll a batch job until it finishes and return validated devices per spec key.
+
+        Requests that failed or produced invalid JSON fall back to spec examples,
+        matching the behaviour of the interactive path.
+        """
+        with self._progress() as progress:
+            task = progress.add_task(f"[cyan]Waiting for batch {batch_id}...", total=None)
+            while True:
+                batch = self.batch_client.batches.retrieve(batch_id)
+                if batch.status in BATCH_TERMINAL_STATES:
+                    break
+                counts = batch.request_counts
+                if counts is not None:
+                    progress.update(task, description=f"[cyan]Batch {batch_id}: {batch.status} "
+                                                      f"({counts.completed}/{counts.total} requests done)")
+                time.sleep(poll_interval)
         
-        # If no JSON found, return the whole content
-        return content.strip()
+        contents = {}
+        if batch.status == 'completed' and batch.output_file_id:
+            output = self.batch_client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = serialization.loads(line)
+                response = record.get('response') or {}
+                if response.get('status_code') == 200:
+                    contents[record['custom_id']] = response['body']['choices'][0]['message']['content']
+        else:
+            self.console.print(f"[yellow]⚠[/yellow] Batch {batch_id} ended with status '{batch.status}'. Falling back to spec examples.")
+        
+        results = {}
+        for spec in devices_spec:
+            resource_type = spec['resource_type']
+            devices = []
+            for instance_id in range(1, spec['count'] + 1):
+                content = contents.get(f"{spec['key']}-{instance_id}")
+                try:
+                    device_data = serialization.loads(content)
+                except Exception:
+                    device_data = self._fallback_from_example(resource_type, instance_id)
+                device_data = self._apply_required_defaults(device_data, resource_type)
+                is_valid, errors, _ = self.validator.validate(device_data, resource_type)
+                if is_valid:
+                    devices.append(device_data)
+                else:
+                    self.console.print(f"[yellow]⚠[/yellow] Batch result {spec['key']}-{instance_id} failed validation: {errors[:2]}")
+            results[spec['key']] = devices
+        return results
 
     def _apply_required_defaults(self, data: Dict, resource_type: str) -> Dict:
         """Apply conservative defaults for frequently-missed required fields.
@@ -291,16 +722,10 @@ class SimulationEngine:
     def _fallback_from_example(self, resource_type: str, instance_id: int) -> Dict:
         """Build a device from example structures when LLM is unavailable."""
         try:
-            example = self.prompt_processor._get_example_structure(resource_type, None) or {}
-            # Ensure minimal required core fields
-            example.setdefault('@odata.type', f'#{resource_type}.v1_0_0.{resource_type}')
+            # The template is shared between calls; each device gets a private copy
+            example = copy.deepcopy(self._fallback_template(resource_type))
             example.setdefault('Id', str(instance_id))
             example.setdefault('Name', f'{resource_type} {instance_id}')
-            status = example.setdefault('Status', {})
-            status.setdefault('State', 'Enabled')
-            status.setdefault('Health', 'OK')
-            # Per-type defaults
-            example = self._apply_required_defaults(example, resource_type)
             return example
         except Exception:
             return {
@@ -310,27 +735,34 @@ class SimulationEngine:
                 'Status': {'State': 'Enabled', 'Health': 'OK'}
             }
 
+    def _fallback_template(self, resource_type: str) -> Dict:
+        """Example structure with the instance-independent required fields filled in (do not mutate)"""
+        template = self._fallback_templates.get(resource_type)
+        if template is None:
+            # _get_example_structure returns a private copy, so it can be completed in place
+            template = self.prompt_processor._get_example_structure(resource_type, None) or {}
+            # Ensure minimal required core fields
+            template.setdefault('@odata.type', f'#{resource_type}.v1_0_0.{resource_type}')
+            status = template.setdefault('Status', {})
+            status.setdefault('State', 'Enabled')
+            status.setdefault('Health', 'OK')
+            # Per-type defaults
+            template = self._fallback_templates[resource_type] = self._apply_required_defaults(template, resource_type)
+        return template
+
     def simulate_operation(self, device: Dict, operation: str) -> Dict:
-        """Simulate an operation on a device"""
-        operations = {
-            "power_on": {"Status": {"State": "Enabled", "Health": "OK"}},
-            "power_off": {"Status": {"State": "Disabled", "Health": "OK"}},
-            "reset": {"Status": {"State": "Enabled", "Health": "OK"}, 
-                     "LastResetTime": time.strftime("%Y-%m-%dT%H:%M:%SZ")},
-            "maintenance": {"Status": {"State": "StandbyOffline", "Health": "Warning"}},
-            "test": {"Status": {"State": "InTest", "Health": "OK"}}
-        }
-        
-        if operation in operations:
-            # Update device state
-            for key, value in operations[operation].items():
-                if isinstance(value, dict) and key in device:
-                    device[key].update(value)
-                else:
-                    device[key] = value
+        """Simulate an operation on a device, returning the updated device without modifying the input"""
+        status = DEVICE_OPERATIONS.get(operation)
+        if status is not None:
+            # Update device state on a new dict; only the touched fields are rebuilt
+            updated = dict(device)
+            current = device.get('Status')
+            updated['Status'] = {**current, **status} if isinstance(current, dict) else dict(status)
+            if operation == 'reset':
+                updated['LastResetTime'] = time.strftime("%Y-%m-%dT%H:%M:%SZ")
             
             self.console.print(f"[green]✓[/green] Executed operation: {operation}")
-            return device
+            return updated
         else:
             self.console.print(f"[red]✗[/red] Unknown operation: {operation}")
             return device
@@ -359,19 +791,7 @@ class SimulationEngine:
 
     def _get_profile_description(self, profile: str) -> str:
         """Get human-readable description for a profile"""
-        descriptions = {
-            'public-localstorage': 'Local storage infrastructure with controllers and drives',
-            'public-bladed': 'Blade server infrastructure with compute and storage',
-            'public-rackmount1': 'Standard rackmount server infrastructure',
-            'public-tower': 'Tower server infrastructure for small deployments',
-            'public-composability': 'Composable infrastructure with dynamic resource allocation',
-            'public-cxl': 'Compute Express Link infrastructure for memory expansion',
-            'public-nvmeof-jbof': 'NVMe over Fabrics with Just a Bunch of Flash',
-            'public-smartnic': 'Smart network interface cards with offload capabilities',
-            'public-telemetry': 'Infrastructure telemetry and monitoring',
-            'public-sasfabric': 'SAS fabric infrastructure for storage connectivity'
-        }
-        return descriptions.get(profile, 'Redfish infrastructure profile')
+        return self.config.PROFILE_DESCRIPTIONS.get(profile, 'Redfish infrastructure profile')
 
     def generate_device_with_specifications(self, device_type: str, resource_type: str,
                                          specifications: Dict, profile: str = None) -> Optional[Dict]:
@@ -387,13 +807,12 @@ class SimulationEngine:
             
             # Generate response
             messages = [
-                SystemMessage(content="You are a Redfish/Swordfish compliance expert. Generate only valid JSON."),
+                SYSTEM_MESSAGE,
                 HumanMessage(content=prompt)
             ]
             
             response = self.llm.invoke(messages)
-            json_str = self._extract_json(response.content)
-            device_data = json.loads(json_str)
+            device_data = serialization.loads(response.content)
             
             # Validate with enhanced validation
             is_valid, errors, validation_result = self.validator.validate(device_data, resource_type)